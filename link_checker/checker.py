@@ -1,6 +1,7 @@
 """Link status checking and redirect tracing module."""
 
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Optional
@@ -91,6 +92,7 @@ class LinkChecker:
         self._host_delays: dict[str, float] = {}
         self._last_request_time: dict[str, float] = {}
         self._retry_stats: dict[str, int] = {}  # Track retry counts per URL
+        self._rate_limit_lock = threading.Lock()  # Serializes slot reservation
     
     def _get_host_delay(self, url: str) -> float:
         """Get the current delay for a host."""
@@ -105,16 +107,24 @@ class LinkChecker:
         logger.info(f"Increased delay for {host} to {self._host_delays[host]}s")
     
     def _rate_limit(self, url: str):
-        """Apply rate limiting for a specific host."""
-        host = get_domain(url)
-        last_time = self._last_request_time.get(host, 0)
+        """Apply rate limiting for a specific host.
+
+        Slot reservation happens under a lock so concurrent callers
+        (check_link runs from a thread pool) queue up on the same host
+        at the configured spacing instead of racing past each other; the
+        sleep itself happens outside the lock so different hosts never
+        block one another.
+        """
         delay = self._get_host_delay(url)
-        
-        elapsed = time.time() - last_time
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
-        
-        self._last_request_time[host] = time.time()
+        host = get_domain(url)
+
+        with self._rate_limit_lock:
+            now = time.time()
+            slot = max(now, self._last_request_time.get(host, 0) + delay)
+            self._last_request_time[host] = slot
+
+        if slot > now:
+            time.sleep(slot - now)
     
     def _should_use_get(self, url: str) -> bool:
         """Check if we should skip HEAD and use GET directly."""
@@ -2,13 +2,26 @@
 
 import csv
 import html
+import io
 import json
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
+# CSV files at least this large are parsed in parallel worker processes.
+PARALLEL_CSV_BYTES = 8 * 1024 * 1024
+
+
+def _parse_csv_chunk(fieldnames: list, chunk: str) -> list:
+    """Parse a block of CSV lines into row dicts (worker for load_csv)."""
+    reader = csv.DictReader(io.StringIO(chunk), fieldnames=fieldnames)
+    return list(reader)
+
 
 class HTMLReportGenerator:
     """Generates interactive HTML reports from CSV link reports."""
@@ -21,10 +34,20 @@ class HTMLReportGenerator:
     
     def load_csv(self, csv_path: str) -> None:
         """Load data from a CSV file."""
-        with open(csv_path, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            self.data = list(reader)
-        
+        csv_stat = os.stat(csv_path)
+        if csv_stat.st_size >= PARALLEL_CSV_BYTES:
+            self.data = self._load_csv_parallel(csv_path)
+        else:
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                self.data = list(reader)
+
+        # Split the pipe-delimited example pages once here so neither the
+        # summary pass nor the embedded JavaScript re-parses it per render.
+        for row in self.data:
+            example = row.get('example_pages')
+            row['example_pages'] = example.split('|') if example else []
+
         if self.data:
             first_source = self.data[0].get('source_page', '')
             if first_source and first_source != 'multiple':
@@ -32,17 +55,63 @@ class HTMLReportGenerator:
                 self.site_domain = f"{parsed.scheme}://{parsed.netloc}"
             else:
                 for row in self.data:
-                    example = row.get('example_pages', '')
+                    example = row.get('example_pages')
                     if example:
-                        first_url = example.split('|')[0]
-                        parsed = urlparse(first_url)
+                        parsed = urlparse(example[0])
                         self.site_domain = f"{parsed.scheme}://{parsed.netloc}"
                         break
         
-        csv_stat = os.stat(csv_path)
         self.report_timestamp = datetime.fromtimestamp(csv_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-        
+
         self._calculate_summary()
+
+    def _load_csv_parallel(self, csv_path: str) -> list:
+        """Parse a large CSV by splitting it into per-process chunks.
+
+        Split points are chosen at newlines that fall outside quoted fields
+        (tracked by quote parity), so rows with embedded newlines stay
+        intact. Each chunk is parsed in a separate process.
+        """
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            header = f.readline()
+            body = f.read()
+        fieldnames = next(csv.reader([header]))
+
+        workers = os.cpu_count() or 1
+        target = max(1, len(body) // workers)
+        bounds = []
+        pos = 0
+        parity = 0
+        for i in range(1, workers):
+            cand = body.find('\n', max(pos, i * target))
+            if cand == -1:
+                break
+            parity = (parity + body.count('"', pos, cand)) % 2
+            while parity and cand != -1:
+                nxt = body.find('\n', cand + 1)
+                if nxt == -1:
+                    cand = -1
+                    break
+                parity = (parity + body.count('"', cand, nxt)) % 2
+                cand = nxt
+            if cand == -1:
+                break
+            bounds.append(cand + 1)
+            pos = cand + 1
+
+        chunks = []
+        start = 0
+        for bound in bounds + [len(body)]:
+            if bound > start:
+                chunks.append(body[start:bound])
+                start = bound
+
+        if len(chunks) <= 1:
+            return _parse_csv_chunk(fieldnames, body)
+
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            parsed = pool.map(partial(_parse_csv_chunk, fieldnames), chunks)
+        return [row for chunk_rows in parsed for row in chunk_rows]
     
     def _calculate_summary(self) -> None:
         """Calculate summary statistics from loaded data."""
@@ -60,15 +129,15 @@ class HTMLReportGenerator:
             },
         }
         
-        for row in self.data:
-            priority = row.get('priority', 'low')
-            issue_type = row.get('issue_type', 'ok')
-            
-            if priority in self.summary['by_priority']:
-                self.summary['by_priority'][priority] += 1
-            
-            if issue_type in self.summary['by_issue_type']:
-                self.summary['by_issue_type'][issue_type] += 1
+        # Counter's C-level counting loop beats per-row dict lookups in
+        # Python; unknown values fall out when merging into the fixed keys.
+        priority_counts = Counter(row.get('priority', 'low') for row in self.data)
+        issue_counts = Counter(row.get('issue_type', 'ok') for row in self.data)
+
+        for key in self.summary['by_priority']:
+            self.summary['by_priority'][key] = priority_counts.get(key, 0)
+        for key in self.summary['by_issue_type']:
+            self.summary['by_issue_type'][key] = issue_counts.get(key, 0)
     
     def generate_html(self, output_path: str, open_browser: bool = False) -> None:
         """Generate HTML report and save to file."""
@@ -81,9 +150,31 @@ class HTMLReportGenerator:
             import webbrowser
             webbrowser.open(f'file://{os.path.abspath(output_path)}')
     
+    def _encode_data(self) -> dict:
+        """Dictionary-encode row data for a compact JSON payload.
+
+        Columns like source_page and status_code repeat heavily across rows,
+        so each distinct string is stored once in a shared table and rows
+        reference it by index. The embedded JavaScript rebuilds plain row
+        objects at boot.
+        """
+        columns = list(self.data[0].keys()) if self.data else []
+        string_table = {}
+
+        def intern(s):
+            return string_table.setdefault(s, len(string_table))
+
+        def encode(value):
+            if isinstance(value, list):
+                return [intern(v) for v in value]
+            return intern(value or '')
+
+        rows = [[encode(row.get(col)) for col in columns] for row in self.data]
+        return {'columns': columns, 'strings': list(string_table), 'rows': rows}
+
     def _build_html(self) -> str:
         """Build the complete HTML document."""
-        data_json = json.dumps(self.data, ensure_ascii=False)
+        data_json = json.dumps(self._encode_data(), ensure_ascii=False)
         summary_json = json.dumps(self.summary, ensure_ascii=False)
         
         return f'''<!DOCTYPE html>
@@ -212,7 +303,7 @@ class HTMLReportGenerator:
     </footer>
     
     <script>
-const reportData = {data_json};
+const reportPayload = {data_json};
 const summaryData = {summary_json};
 
 {self._get_javascript()}
@@ -738,6 +829,19 @@ body {
     def _get_javascript(self) -> str:
         """Return the JavaScript code."""
         return '''
+const reportData = (() => {
+    const S = reportPayload.strings;
+    const cols = reportPayload.columns;
+    return reportPayload.rows.map(r => {
+        const o = {};
+        for (let i = 0; i < cols.length; i++) {
+            const v = r[i];
+            o[cols[i]] = Array.isArray(v) ? v.map(j => S[j]) : S[v];
+        }
+        return o;
+    });
+})();
+
 let currentPriority = '';
 let currentIssueType = '';
 let currentLinkType = '';
@@ -767,28 +871,28 @@ function setupEventListeners() {
             document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
             tab.classList.add('active');
             currentPriority = tab.dataset.priority;
-            renderIssues();
+            applyFilters();
         });
     });
     
     document.getElementById('search-input').addEventListener('input', (e) => {
         searchQuery = e.target.value.toLowerCase();
-        renderIssues();
+        applyFilters();
     });
     
     document.getElementById('issue-type-filter').addEventListener('change', (e) => {
         currentIssueType = e.target.value;
-        renderIssues();
+        applyFilters();
     });
     
     document.getElementById('link-type-filter').addEventListener('change', (e) => {
         currentLinkType = e.target.value;
-        renderIssues();
+        applyFilters();
     });
     
     document.getElementById('status-filter').addEventListener('change', (e) => {
         currentStatusCode = e.target.value;
-        renderIssues();
+        applyFilters();
     });
     
     document.getElementById('clear-filters').addEventListener('click', () => {
@@ -800,32 +904,54 @@ function setupEventListeners() {
         document.getElementById('issue-type-filter').value = '';
         document.getElementById('link-type-filter').value = '';
         document.getElementById('status-filter').value = '';
-        renderIssues();
+        applyFilters();
     });
     
     document.getElementById('export-csv').addEventListener('click', exportFilteredCSV);
     document.getElementById('print-report').addEventListener('click', () => window.print());
+
+    // One delegated listener handles every copy button, instead of
+    // re-attaching per-button listeners after each render.
+    document.getElementById('issues-container').addEventListener('click', (e) => {
+        const btn = e.target.closest('.copy-btn');
+        if (!btn) return;
+        navigator.clipboard.writeText(btn.dataset.copy).then(() => {
+            btn.classList.add('copied');
+            const originalText = btn.textContent;
+            btn.textContent = 'Copied!';
+            setTimeout(() => {
+                btn.classList.remove('copied');
+                btn.textContent = originalText;
+            }, 1500);
+        });
+    });
+}
+
+let activeFilter = null;
+
+function compileFilter() {
+    // Filters change rarely but rows are scanned on every render, so the
+    // active filter set is compiled to a single predicate function with
+    // the disabled checks removed entirely.
+    const clauses = [];
+    if (currentPriority) clauses.push(`r.priority === ${JSON.stringify(currentPriority)}`);
+    if (currentIssueType) clauses.push(`r.issue_type === ${JSON.stringify(currentIssueType)}`);
+    if (currentLinkType) clauses.push(`r.link_type === ${JSON.stringify(currentLinkType)}`);
+    if (currentStatusCode) clauses.push(`r.status_code === ${JSON.stringify(currentStatusCode)}`);
+    if (searchQuery) {
+        clauses.push(`[r.link_url, r.source_page, r.example_pages.join('|'), r.link_text]` +
+            `.join(' ').toLowerCase().includes(${JSON.stringify(searchQuery)})`);
+    }
+    activeFilter = clauses.length ? new Function('r', 'return ' + clauses.join(' && ') + ';') : null;
+}
+
+function applyFilters() {
+    compileFilter();
+    renderIssues();
 }
 
 function filterData() {
-    return reportData.filter(item => {
-        if (currentPriority && item.priority !== currentPriority) return false;
-        if (currentIssueType && item.issue_type !== currentIssueType) return false;
-        if (currentLinkType && item.link_type !== currentLinkType) return false;
-        if (currentStatusCode && item.status_code !== currentStatusCode) return false;
-        
-        if (searchQuery) {
-            const searchFields = [
-                item.link_url,
-                item.source_page,
-                item.example_pages,
-                item.link_text,
-            ].join(' ').toLowerCase();
-            if (!searchFields.includes(searchQuery)) return false;
-        }
-        
-        return true;
-    });
+    return activeFilter ? reportData.filter(activeFilter) : reportData;
 }
 
 function renderIssues() {
@@ -839,21 +965,6 @@ function renderIssues() {
     }
     
     container.innerHTML = filtered.map(item => createIssueCard(item)).join('');
-    
-    container.querySelectorAll('.copy-btn').forEach(btn => {
-        btn.addEventListener('click', () => {
-            const text = btn.dataset.copy;
-            navigator.clipboard.writeText(text).then(() => {
-                btn.classList.add('copied');
-                const originalText = btn.textContent;
-                btn.textContent = 'Copied!';
-                setTimeout(() => {
-                    btn.classList.remove('copied');
-                    btn.textContent = originalText;
-                }, 1500);
-            });
-        });
-    });
 }
 
 function createIssueCard(item) {
@@ -880,8 +991,8 @@ function createIssueCard(item) {
     const occurrenceCount = parseInt(item.occurrence_count) || 1;
     
     let pagesHtml = '';
-    if (item.source_page === 'multiple' && item.example_pages) {
-        const pages = item.example_pages.split('|');
+    if (item.source_page === 'multiple' && item.example_pages.length) {
+        const pages = item.example_pages;
         pagesHtml = `
             <div class="issue-field">
                 <div class="issue-field-label">Found on ${occurrenceCount} pages</div>
@@ -988,19 +1099,22 @@ function exportFilteredCSV() {
     }
     
     const headers = Object.keys(filtered[0]);
-    const csvContent = [
-        headers.join(','),
-        ...filtered.map(row => 
-            headers.map(h => {
-                const val = row[h] || '';
-                return val.includes(',') || val.includes('"') || val.includes('\\n') 
-                    ? `"${val.replace(/"/g, '""')}"` 
-                    : val;
-            }).join(',')
-        )
-    ].join('\\n');
-    
-    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+    // Preallocate one line slot per row and hand the parts array straight
+    // to Blob, so no single giant string is ever materialized.
+    const parts = new Array(filtered.length + 1);
+    parts[0] = headers.join(',') + '\\n';
+    for (let i = 0; i < filtered.length; i++) {
+        const row = filtered[i];
+        parts[i + 1] = headers.map(h => {
+            const raw = row[h];
+            const val = Array.isArray(raw) ? raw.join('|') : (raw || '');
+            return val.includes(',') || val.includes('"') || val.includes('\\n')
+                ? `"${val.replace(/"/g, '""')}"`
+                : val;
+        }).join(',') + '\\n';
+    }
+
+    const blob = new Blob(parts, { type: 'text/csv;charset=utf-8;' });
     const link = document.createElement('a');
     link.href = URL.createObjectURL(blob);
     link.download = 'link_report_filtered.csv';
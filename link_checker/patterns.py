@@ -4,10 +4,70 @@ Supports glob and regex patterns for include/exclude filtering.
 """
 
 import fnmatch
+import functools
 import re
 from typing import List, Optional
 from urllib.parse import urlparse
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Extracts the path component of an absolute URL without the full
+# urlparse machinery; anything scheme-less falls back to urlparse.
+_PATH_RE = re.compile(r'^[a-z][a-z0-9+.\-]*://[^/?#]*([^?#]*)')
+
+
+def _extract_path(url_lower: str) -> str:
+    """Return the lowered path component of an already-lowered URL."""
+    match = _PATH_RE.match(url_lower)
+    if match:
+        return match.group(1)
+    return urlparse(url_lower).path
+
+
+def _build_hyperscan_db(patterns: List[str]):
+    """
+    Compile patterns into a Hyperscan database, or None when unavailable.
+
+    Hyperscan scans all patterns in a single SIMD-accelerated pass, which
+    beats looping `re.search` over each pattern once the set grows past a
+    handful. Patterns using constructs Hyperscan rejects (back-references,
+    look-around) make the whole set fall back to the `re` loop so matching
+    semantics never silently change.
+    """
+    if hyperscan is None or not patterns:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode('utf-8') for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[
+                hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            ] * len(patterns),
+        )
+        return db
+    except Exception:
+        return None
+
+
+def _hyperscan_any(db, text: str) -> bool:
+    """Return True if any pattern in the database matches the text."""
+    hits: List[int] = []
+    db.scan(
+        text.encode('utf-8', errors='ignore'),
+        match_event_handler=lambda pat_id, start, end, flags, ctx: ctx.append(pat_id),
+        context=hits,
+    )
+    return bool(hits)
+
 
 class URLPatternMatcher:
     """Match URLs against include/exclude patterns."""
@@ -29,11 +89,11 @@ class URLPatternMatcher:
         self.include_patterns = include_patterns or []
         self.exclude_patterns = exclude_patterns or []
         self.pattern_type = pattern_type
-        
+
         # Compile regex patterns if using regex
         self._compiled_include = []
         self._compiled_exclude = []
-        
+
         if pattern_type == "regex":
             self._compiled_include = [
                 re.compile(p, re.IGNORECASE) for p in self.include_patterns
@@ -41,103 +101,202 @@ class URLPatternMatcher:
             self._compiled_exclude = [
                 re.compile(p, re.IGNORECASE) for p in self.exclude_patterns
             ]
+            # Large pattern sets (stacked presets plus custom patterns) get
+            # a single-pass Hyperscan scan when the library is installed.
+            self._include_hs = _build_hyperscan_db(self.include_patterns)
+            self._exclude_hs = _build_hyperscan_db(self.exclude_patterns)
+        else:
+            # Glob patterns are translated once into a single compiled
+            # alternation per side (one matched against the full URL, one
+            # against the path), so each URL costs one regex scan instead
+            # of a Python-level loop over every pattern.
+            (self._include_url_re, self._include_path_re,
+             self._include_ac, self._include_needles) = (
+                self._build_glob_regexes(self.include_patterns)
+            )
+            (self._exclude_url_re, self._exclude_path_re,
+             self._exclude_ac, self._exclude_needles) = (
+                self._build_glob_regexes(self.exclude_patterns)
+            )
+            self._has_path_patterns = (
+                self._include_path_re is not None
+                or self._exclude_path_re is not None
+            )
+
+        # Crawl outputs repeat URLs heavily (same asset linked from many
+        # pages); memoize per matcher instance so repeats skip the matchers.
+        self._should_check_cached = functools.lru_cache(maxsize=65536)(
+            self._compute_should_check
+        )
+
+    @staticmethod
+    def _build_glob_regexes(
+        patterns: List[str],
+    ) -> tuple[Optional[re.Pattern], Optional[re.Pattern], Optional[object], tuple]:
+        """
+        Translate glob patterns into (url_regex, path_regex, automaton, needles).
+
+        Substring-style patterns (the common preset form) are collected as
+        plain needles and, when pyahocorasick is installed, matched with a
+        single Aho-Corasick automaton so one linear scan over the URL covers
+        every needle. Without pyahocorasick they are returned as a tuple of
+        lowered needles scanned with the C-level substring operator.
+
+        Preserves the historical matching rules:
+        - Path patterns (`/blog/*`): fnmatch against the URL path, with a
+          substring fallback.
+        - Patterns with a leading and/or trailing `*`: substring match of the
+          stripped needle anywhere in the URL (suffix/prefix checks were
+          always subsumed by the substring check).
+        - Wildcard in the middle (`a*b`): full fnmatch against the URL.
+        - No wildcards: substring match.
+        """
+        url_frags = []
+        path_frags = []
+        needles = []
+
+        for pattern in patterns:
+            if pattern.startswith('/'):
+                path_frags.append(r'\A' + fnmatch.translate(pattern))
+                path_frags.append(re.escape(pattern))
+            elif pattern.startswith('*') and pattern.endswith('*'):
+                needles.append(pattern.strip('*').lower())
+            elif pattern.startswith('*'):
+                needles.append(pattern[1:].lower())
+            elif pattern.endswith('*'):
+                needles.append(pattern[:-1].lower())
+            elif '*' in pattern:
+                url_frags.append(r'\A' + fnmatch.translate(pattern))
+            else:
+                needles.append(pattern.lower())
+
+        # A bare '*' pattern strips down to an empty needle; it matches
+        # everything and the automaton cannot hold it, but '' in url is
+        # True, so the needle-tuple scan handles it naturally.
+        empty_needles = [n for n in needles if not n]
+        needles = [n for n in needles if n]
+
+        automaton = None
+        if ahocorasick is not None and needles:
+            automaton = ahocorasick.Automaton()
+            for i, needle in enumerate(needles):
+                automaton.add_word(needle, i)
+            automaton.make_automaton()
+            needles = []
+
+        needle_tuple = tuple(needles + empty_needles)
+
+        url_re = (
+            re.compile('|'.join(f'(?:{f})' for f in url_frags), re.IGNORECASE)
+            if url_frags else None
+        )
+        path_re = (
+            re.compile('|'.join(f'(?:{f})' for f in path_frags), re.IGNORECASE)
+            if path_frags else None
+        )
+        return url_re, path_re, automaton, needle_tuple
 
     def should_check(self, url: str) -> tuple[bool, str]:
         """
         Check if a URL should be checked based on patterns.
-        
+
         Args:
             url: URL to check
-        
+
         Returns:
             Tuple of (should_check, reason)
         """
+        return self._should_check_cached(url)
+
+    def _compute_should_check(self, url: str) -> tuple[bool, str]:
+        """Uncached matching core behind should_check."""
         # If no patterns, check everything
         if not self.include_patterns and not self.exclude_patterns:
             return True, "no patterns"
-        
+
+        # Lowercase once; every matcher below works on the lowered URL.
+        url_lower = url.lower()
+
+        # Parse the path once, and only when some pattern needs it.
+        path_lower = None
+        if self.pattern_type != "regex" and self._has_path_patterns:
+            path_lower = _extract_path(url_lower)
+
         # Check exclude patterns first
-        if self._matches_exclude(url):
+        if self._matches_exclude(url, url_lower, path_lower):
             return False, f"excluded by pattern"
-        
+
         # Check include patterns
         if self.include_patterns:
-            if self._matches_include(url):
+            if self._matches_include(url, url_lower, path_lower):
                 return True, "matched include pattern"
             else:
                 return False, "not in include patterns"
-        
+
         return True, "not excluded"
 
-    def _matches_include(self, url: str) -> bool:
+    def _matches_include(
+        self,
+        url: str,
+        url_lower: Optional[str] = None,
+        path_lower: Optional[str] = None,
+    ) -> bool:
         """Check if URL matches any include pattern."""
         if not self.include_patterns:
             return True
-        
+
         if self.pattern_type == "regex":
+            if self._include_hs is not None:
+                return _hyperscan_any(self._include_hs, url)
             return any(p.search(url) for p in self._compiled_include)
-        else:
-            # Glob matching
-            return any(self._glob_match(url, p) for p in self.include_patterns)
+        return self._glob_side_matches(
+            url_lower if url_lower is not None else url.lower(),
+            self._include_url_re, self._include_path_re, self._include_ac,
+            path_lower, self._include_needles,
+        )
 
-    def _matches_exclude(self, url: str) -> bool:
+    def _matches_exclude(
+        self,
+        url: str,
+        url_lower: Optional[str] = None,
+        path_lower: Optional[str] = None,
+    ) -> bool:
         """Check if URL matches any exclude pattern."""
         if not self.exclude_patterns:
             return False
-        
+
         if self.pattern_type == "regex":
+            if self._exclude_hs is not None:
+                return _hyperscan_any(self._exclude_hs, url)
             return any(p.search(url) for p in self._compiled_exclude)
-        else:
-            # Glob matching
-            return any(self._glob_match(url, p) for p in self.exclude_patterns)
-
-    def _glob_match(self, url: str, pattern: str) -> bool:
-        """
-        Match URL against glob pattern.
-
-        Supports:
-        - * matches any characters (non-greedy)
-        - ** matches any characters across path segments
-        - ? matches single character
-        - [abc] character sets
-
-        Pattern types:
-        - Domain patterns: *linkedin.com* (wraps with wildcards)
-        - Path patterns: /blog/*, /docs/**/*.md
-        - Extension patterns: *.pdf, *.jpg
-        """
-        pattern_lower = pattern.lower()
-        url_lower = url.lower()
-
-        # Path pattern: starts with / - match against URL path
-        if pattern.startswith('/'):
-            parsed = urlparse(url)
-            path = parsed.path.lower()
-            # Use fnmatch on the path
-            return fnmatch.fnmatch(path, pattern_lower) or pattern_lower in path
-
-        # Full wildcard pattern: *something* - match anywhere in URL
-        if pattern.startswith('*') and pattern.endswith('*'):
-            # Remove wildcards and check if contained
-            search = pattern_lower.strip('*')
-            return search in url_lower
+        return self._glob_side_matches(
+            url_lower if url_lower is not None else url.lower(),
+            self._exclude_url_re, self._exclude_path_re, self._exclude_ac,
+            path_lower, self._exclude_needles,
+        )
 
-        # Prefix wildcard: *something - check suffix
-        if pattern.startswith('*'):
-            suffix = pattern_lower[1:]
-            return url_lower.endswith(suffix) or suffix in url_lower
-
-        # Suffix wildcard: something* - check prefix or extension
-        if pattern.endswith('*'):
-            prefix = pattern_lower[:-1]
-            return url_lower.startswith(prefix) or prefix in url_lower
-
-        # Has wildcard in middle: something*something
-        if '*' in pattern:
-            return fnmatch.fnmatch(url_lower, pattern_lower)
-
-        # No wildcards: substring match
-        return pattern_lower in url_lower
+    @staticmethod
+    def _glob_side_matches(
+        url_lower: str,
+        url_re: Optional[re.Pattern],
+        path_re: Optional[re.Pattern],
+        automaton: Optional[object] = None,
+        path_lower: Optional[str] = None,
+        needles: tuple = (),
+    ) -> bool:
+        """Match an already-lowered URL against one side's compiled matchers."""
+        if needles and any(n in url_lower for n in needles):
+            return True
+        if automaton is not None and next(automaton.iter(url_lower), None) is not None:
+            return True
+        if url_re is not None and url_re.search(url_lower):
+            return True
+        if path_re is not None:
+            if path_lower is None:
+                path_lower = _extract_path(url_lower)
+            if path_re.search(path_lower):
+                return True
+        return False
 
     def filter_urls(self, urls: List[str]) -> tuple[List[str], List[str]]:
         """
@@ -149,16 +308,14 @@ class URLPatternMatcher:
         Returns:
             Tuple of (included_urls, excluded_urls)
         """
-        included = []
-        excluded = []
-        
-        for url in urls:
-            should_check, reason = self.should_check(url)
-            if should_check:
-                included.append(url)
-            else:
-                excluded.append(url)
-        
+        # Decide each unique URL once; duplicates reuse the decision.
+        decisions = {
+            url: self.should_check(url)[0] for url in dict.fromkeys(urls)
+        }
+
+        included = [url for url in urls if decisions[url]]
+        excluded = [url for url in urls if not decisions[url]]
+
         return included, excluded
 
     def get_stats(self) -> dict:
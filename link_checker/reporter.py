@@ -3,9 +3,10 @@
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, fields as dataclass_fields
-from typing import Optional
+from typing import Iterable, Optional
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 
 from .checker import LinkStatus
@@ -54,6 +55,12 @@ class ReportRow:
     anchor_quality: str = ''
 
 
+REPORT_COLUMNS = tuple(f.name for f in dataclass_fields(ReportRow))
+
+# Ordered priority levels, most urgent first (drives report sorting).
+PRIORITY_LEVELS = ('critical', 'high', 'medium', 'low', 'info')
+
+
 class ReportGenerator:
     """Generates CSV reports from crawl and check results."""
     
@@ -210,45 +217,202 @@ class ReportGenerator:
         
         return ''
     
+    def _classify_groups(self, groups: list) -> tuple:
+        """
+        Vectorized equivalent of the per-row _determine_issue_type /
+        _determine_priority / _generate_fix_recommendation chain.
+
+        Builds numpy arrays of the status fields for all link groups at
+        once and classifies them with np.select, so classification costs a
+        handful of C-level comparisons instead of three branchy Python
+        calls per link. The scalar methods above remain the reference
+        implementation for the decision order mirrored here.
+
+        Args:
+            groups: list of (link_url, occurrences, status) tuples
+
+        Returns:
+            Tuple of (issue_types, priorities, hop_counts, fixes) arrays.
+        """
+        n = len(groups)
+        status_code = np.fromiter(
+            (g[2].status_code for g in groups), dtype=np.int64, count=n
+        )
+        is_loop = np.fromiter((g[2].is_loop for g in groups), dtype=bool, count=n)
+        has_error = np.fromiter(
+            (bool(g[2].error) for g in groups), dtype=bool, count=n
+        )
+        is_redirect = np.fromiter(
+            (g[2].is_redirect for g in groups), dtype=bool, count=n
+        )
+        is_canonical = np.fromiter(
+            (g[2].is_canonical_redirect for g in groups), dtype=bool, count=n
+        )
+        hop_counts = np.fromiter(
+            ((len(g[2].redirect_chain) - 1 if g[2].redirect_chain else 0)
+             for g in groups),
+            dtype=np.int64, count=n,
+        )
+        is_internal = np.fromiter(
+            (g[1][0].is_internal for g in groups), dtype=bool, count=n
+        )
+        is_mixed = np.fromiter(
+            (g[1][0].is_mixed_content for g in groups), dtype=bool, count=n
+        )
+        final_urls = pd.Series([g[2].final_url for g in groups], dtype=object)
+
+        issue_types = np.select(
+            [
+                is_mixed,
+                is_loop,
+                has_error,
+                status_code == 404,
+                status_code == 410,
+                status_code >= 500,
+                status_code >= 400,
+                ~is_redirect,
+                is_canonical,
+                hop_counts >= 2,
+            ],
+            [
+                'mixed_content',
+                'redirect_loop',
+                'error',
+                'broken_404',
+                'broken_410',
+                'broken_5xx',
+                'broken',
+                'ok',
+                'canonical_redirect',
+                'redirect_chain',
+            ],
+            default='redirect',
+        ).astype(object)
+
+        if self.baseline_urls:
+            for i in np.nonzero(issue_types == 'broken_404')[0]:
+                if normalize_url(groups[i][0]) in self.baseline_urls:
+                    issue_types[i] = 'preview_404'
+
+        is_404 = issue_types == 'broken_404'
+        is_broken = issue_types == 'broken'
+        is_chain = issue_types == 'redirect_chain'
+        is_plain_redirect = issue_types == 'redirect'
+        is_mixed_issue = issue_types == 'mixed_content'
+
+        priorities = np.select(
+            [
+                issue_types == 'preview_404',
+                issue_types == 'redirect_loop',
+                is_chain & (hop_counts >= 3),
+                (issue_types == 'broken_5xx') & is_internal,
+                is_mixed_issue & is_internal,
+                is_404 & is_internal,
+                is_broken & is_internal,
+                is_mixed_issue & ~is_internal,
+                (issue_types == 'broken_410') & is_internal,
+                is_chain,
+                is_plain_redirect & is_internal,
+                issue_types == 'canonical_redirect',
+            ],
+            [
+                'info', 'critical', 'critical', 'critical',
+                'high', 'high', 'high',
+                'medium', 'medium',
+                'high', 'medium', 'medium',
+            ],
+            default='low',
+        ).astype(object)
+
+        hop_strs = pd.Series(hop_counts).astype(str)
+        chain_fix = (
+            'High priority: Update to ' + final_urls
+            + ' to eliminate ' + hop_strs + ' redirect hops'
+        )
+        redirect_fix = 'Update link to: ' + final_urls
+        canonical_fix = (
+            'Update to canonical form: ' + final_urls + ' (trailing slash/case)'
+        )
+
+        fixes = np.select(
+            [
+                issue_types == 'preview_404',
+                is_mixed_issue,
+                issue_types == 'redirect_loop',
+                is_chain,
+                is_plain_redirect,
+                issue_types == 'canonical_redirect',
+                (is_broken | is_404) & is_internal,
+                (is_broken | is_404) & ~is_internal,
+                issue_types == 'broken_410',
+                issue_types == 'broken_5xx',
+                issue_types == 'error',
+            ],
+            [
+                self._generate_fix_recommendation('preview_404', True, ''),
+                self._generate_fix_recommendation('mixed_content', True, ''),
+                'Remove link - redirect loop detected',
+                chain_fix,
+                redirect_fix,
+                canonical_fix,
+                'Remove link or update to valid page',
+                'Remove link or find replacement',
+                'Page is permanently gone (410 Gone) — remove or update this link',
+                'Server error — check server health; may be transient, retry later',
+                'Check link manually - request failed',
+            ],
+            default='',
+        ).astype(object)
+
+        return issue_types, priorities, hop_counts, fixes
+
     def generate_report(
         self,
         links: list[ExtractedLink],
         link_statuses: dict[str, LinkStatus],
+        link_occurrences: Optional[dict[str, list[ExtractedLink]]] = None,
     ) -> pd.DataFrame:
         """
         Generate a report DataFrame from crawl and check results.
-        
+
         Args:
             links: List of extracted links from crawling
             link_statuses: Dictionary mapping URLs to their status
-        
+            link_occurrences: Links already grouped by URL, when the caller
+                has them (saves regrouping a large link list)
+
         Returns:
             pandas DataFrame with report data
         """
-        link_occurrences: dict[str, list[ExtractedLink]] = defaultdict(list)
-        for link in links:
-            link_occurrences[link.link_url].append(link)
-        
-        rows = []
-        
+        if link_occurrences is None:
+            link_occurrences = defaultdict(list)
+            for link in links:
+                link_occurrences[link.link_url].append(link)
+
+        groups = []
         for link_url, occurrences in link_occurrences.items():
             status = link_statuses.get(link_url)
-            if status is None:
-                continue
-            
-            issue_type = self._determine_issue_type(status, occurrences[0])
+            if status is not None:
+                groups.append((link_url, occurrences, status))
+
+        if not groups:
+            return pd.DataFrame({name: [] for name in REPORT_COLUMNS})
+
+        issue_types, priorities, hop_counts, fixes = self._classify_groups(groups)
+
+        # Accumulate per-column lists and hand them to pandas directly;
+        # this skips a dataclass instance and a vars() dict per row.
+        cols: dict[str, list] = {name: [] for name in REPORT_COLUMNS}
 
-            if issue_type == 'broken_404' and self.baseline_urls:
-                if normalize_url(link_url) in self.baseline_urls:
-                    issue_type = 'preview_404'
+        for i, (link_url, occurrences, status) in enumerate(groups):
+            issue_type = issue_types[i]
 
             if self.skip_ok and issue_type == 'ok':
                 continue
-            
+
             is_internal = occurrences[0].is_internal
-            hop_count = len(status.redirect_chain) - 1 if status.redirect_chain else 0
-            
-            priority = self._determine_priority(issue_type, is_internal, hop_count)
+            hop_count = hop_counts[i]
+            priority = priorities[i]
 
             if self.fp_logger is not None:
                 self.fp_logger.log_classification(
@@ -261,78 +425,75 @@ class ReportGenerator:
                     assigned_priority=priority,
                 )
 
-            recommended_fix = self._generate_fix_recommendation(
-                issue_type, is_internal, status.final_url, hop_count
-            )
-            
+            recommended_fix = fixes[i]
+
             link_text = occurrences[0].link_text
 
             first_element_type = occurrences[0].element_type
 
+            link_type = 'internal' if is_internal else 'external'
+            redirect_chain = status.redirect_chain_formatted
+            final_url = status.final_url if status.is_redirect else ''
+
+            def emit(source_page, occurrence_count, example_pages,
+                     row_link_text, element_type):
+                cols['source_page'].append(source_page)
+                cols['occurrence_count'].append(occurrence_count)
+                cols['example_pages'].append(example_pages)
+                cols['link_url'].append(link_url)
+                cols['link_text'].append(row_link_text)
+                cols['link_type'].append(link_type)
+                cols['element_type'].append(element_type)
+                cols['status_code'].append(status.status_code)
+                cols['issue_type'].append(issue_type)
+                cols['priority'].append(priority)
+                cols['redirect_chain'].append(redirect_chain)
+                cols['final_url'].append(final_url)
+                cols['recommended_fix'].append(recommended_fix)
+                cols['response_time_ms'].append(status.response_time_ms)
+                cols['anchor_quality'].append(
+                    _classify_anchor_quality(row_link_text, element_type)
+                )
+
             if self.expand_duplicates:
                 for occ in occurrences:
                     occ_link_text = occ.link_text or link_text
-                    rows.append(ReportRow(
-                        source_page=occ.source_url,
-                        occurrence_count=1,
-                        example_pages='',
-                        link_url=link_url,
-                        link_text=occ_link_text,
-                        link_type='internal' if is_internal else 'external',
-                        element_type=occ.element_type,
-                        status_code=status.status_code,
-                        issue_type=issue_type,
-                        priority=priority,
-                        redirect_chain=status.redirect_chain_formatted,
-                        final_url=status.final_url if status.is_redirect else '',
-                        recommended_fix=recommended_fix,
-                        response_time_ms=status.response_time_ms,
-                        anchor_quality=_classify_anchor_quality(occ_link_text, occ.element_type),
-                    ))
+                    emit(occ.source_url, 1, '', occ_link_text, occ.element_type)
             else:
                 occurrence_count = len(occurrences)
-                source_pages = [occ.source_url for occ in occurrences]
 
-                if occurrence_count <= 5:
-                    source_page = source_pages[0] if occurrence_count == 1 else 'multiple'
-                    example_pages = '|'.join(source_pages) if occurrence_count > 1 else ''
+                # Single-occurrence rows (the common case) skip the
+                # source-page list and example join entirely.
+                if occurrence_count == 1:
+                    source_page = occurrences[0].source_url
+                    example_pages = ''
                 else:
                     source_page = 'multiple'
-                    example_pages = '|'.join(source_pages[:5])
+                    example_pages = '|'.join(
+                        occ.source_url for occ in occurrences[:5]
+                    )
+
+                emit(source_page, occurrence_count, example_pages,
+                     link_text, first_element_type)
+
+        df = pd.DataFrame(cols)
 
-                rows.append(ReportRow(
-                    source_page=source_page,
-                    occurrence_count=occurrence_count,
-                    example_pages=example_pages,
-                    link_url=link_url,
-                    link_text=link_text,
-                    link_type='internal' if is_internal else 'external',
-                    element_type=first_element_type,
-                    status_code=status.status_code,
-                    issue_type=issue_type,
-                    priority=priority,
-                    redirect_chain=status.redirect_chain_formatted,
-                    final_url=status.final_url if status.is_redirect else '',
-                    recommended_fix=recommended_fix,
-                    response_time_ms=status.response_time_ms,
-                    anchor_quality=_classify_anchor_quality(link_text, first_element_type),
-                ))
-        
-        df = pd.DataFrame([vars(row) for row in rows])
-        
         if not df.empty:
-            priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'info': 4}
-            df['priority_sort'] = df['priority'].map(priority_order)
-            df = df.sort_values(['priority_sort', 'occurrence_count'], ascending=[True, False])
-            df = df.drop('priority_sort', axis=1)
-        
+            # Ordered categoricals sort natively and store codes instead of
+            # per-row strings, so no helper sort column is needed.
+            df['priority'] = pd.Categorical(
+                df['priority'], categories=PRIORITY_LEVELS, ordered=True
+            )
+            df['issue_type'] = df['issue_type'].astype('category')
+            df = df.sort_values(['priority', 'occurrence_count'], ascending=[True, False])
+
         return df
     
     # Orphaned page detection — sitemap mode only
     def generate_orphan_report(
         self,
         sitemap_urls: list[str],
-        all_links: list[ExtractedLink],
+        all_links: Iterable[ExtractedLink],
     ) -> pd.DataFrame:
         """
         Detect orphaned pages: sitemap pages with no internal links pointing to them.
@@ -344,7 +505,8 @@ class ReportGenerator:
         Args:
             sitemap_urls: All page URLs parsed from the sitemap (the pages that
                           were scheduled for crawling).
-            all_links:    All ExtractedLink objects collected during the crawl.
+            all_links:    All ExtractedLink objects collected during the crawl
+                          (any iterable; consumed in a single pass).
 
         Returns:
             A DataFrame with one row per orphaned page, using the same columns
@@ -389,7 +551,7 @@ class ReportGenerator:
         orphaned_normalized = set(normalized_sitemap.keys()) - linked_urls
 
         if not orphaned_normalized:
-            return pd.DataFrame(columns=[f.name for f in dataclass_fields(ReportRow)])
+            return pd.DataFrame(columns=list(REPORT_COLUMNS))
 
         _FIX = (
             'No internal links point to this page. '
@@ -397,34 +559,49 @@ class ReportGenerator:
             'if it should not be indexed.'
         )
 
-        rows = []
-        for normed in sorted(orphaned_normalized):
-            original_url = normalized_sitemap[normed]
-            rows.append(ReportRow(
-                source_page='',
-                occurrence_count=0,
-                example_pages='',
-                link_url=original_url,
-                link_text='',
-                link_type='internal',
-                element_type='',
-                status_code=0,
-                issue_type='orphaned_page',
-                priority='medium',
-                redirect_chain='',
-                final_url='',
-                recommended_fix=_FIX,
-                response_time_ms=None,
-                anchor_quality='',
-            ))
+        # Plain tuples in REPORT_COLUMNS order; no per-row dataclass needed.
+        rows = [
+            ('', 0, '', normalized_sitemap[normed], '', 'internal', '',
+             0, 'orphaned_page', 'medium', '', '', _FIX, None, '')
+            for normed in sorted(orphaned_normalized)
+        ]
 
-        return pd.DataFrame([vars(row) for row in rows])
+        return pd.DataFrame.from_records(rows, columns=list(REPORT_COLUMNS))
 
     def save_report(self, df: pd.DataFrame, output_path: str):
-        """Save the report to a CSV file."""
-        df.to_csv(output_path, index=False)
+        """Save the report to a CSV file.
+
+        Uses Arrow's CSV writer when pyarrow is installed — it serializes
+        from native buffers instead of per-cell Python objects — and falls
+        back to pandas otherwise.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            df.to_csv(output_path, index=False)
+        else:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, output_path)
         logger.info(f"Report saved to {output_path}")
     
+    @staticmethod
+    def _count_column(series: pd.Series) -> dict:
+        """
+        Count occurrences of each value in a report column.
+
+        Categorical columns are counted with a single bincount over the
+        category codes; object columns (e.g. after a concat with the orphan
+        report) fall back to value_counts.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            counts = np.bincount(
+                codes[codes >= 0], minlength=len(series.cat.categories)
+            )
+            return dict(zip(series.cat.categories, counts.tolist()))
+        return series.value_counts().to_dict()
+
     def get_summary(self, df: pd.DataFrame) -> dict:
         """Generate summary statistics from the report."""
         if df.empty:
@@ -450,8 +627,8 @@ class ReportGenerator:
                 'weak_anchors': 0,
             }
 
-        issue_counts = df['issue_type'].value_counts().to_dict()
-        priority_counts = df['priority'].value_counts().to_dict()
+        issue_counts = self._count_column(df['issue_type'])
+        priority_counts = self._count_column(df['priority'])
 
         return {
             'total_links': len(df),
@@ -4,10 +4,14 @@ Implements robots.txt protocol for professional crawler etiquette.
 Prevents getting IP banned by respecting site policies.
 """
 
+import functools
 import logging
+import os
+import re
+import sqlite3
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 from urllib.parse import urlparse
 
 import requests
@@ -15,6 +19,55 @@ import requests
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _compile_robots_pattern(pattern: str) -> Optional[re.Pattern]:
+    """
+    Translate a robots.txt pattern into a compiled regex.
+
+    Returns None for plain patterns where a prefix test suffices; only
+    patterns containing '*' or '$' need a regex. Cached globally, since the
+    same patterns (/wp-admin/, /search, ...) recur across domains.
+    """
+    if '*' not in pattern and '$' not in pattern:
+        return None
+
+    regex_pattern = ''
+    for char in pattern:
+        if char == '*':
+            regex_pattern += '.*'
+        elif char == '$':
+            regex_pattern += '$'
+        elif char in '.^+?{}[]|()\\':
+            regex_pattern += '\\' + char
+        else:
+            regex_pattern += char
+
+    if not regex_pattern.endswith('$'):
+        regex_pattern += '.*'
+
+    return re.compile(regex_pattern)
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_robots_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Build a path-matching callable for a robots.txt pattern.
+
+    Each pattern is classified once — root (always matches), wildcard
+    (compiled regex) or plain prefix — so the per-check call is a direct
+    dispatch with no re-inspection of the pattern string.
+    """
+    if pattern == '/':
+        return lambda path: True
+
+    compiled = _compile_robots_pattern(pattern)
+    if compiled is not None:
+        match = compiled.match
+        return lambda path: match(path) is not None
+
+    return lambda path: path.startswith(pattern)
+
+
 @dataclass
 class RobotsRule:
     """A single robots.txt rule."""
@@ -22,6 +75,105 @@ class RobotsRule:
     allow_paths: list[str] = field(default_factory=list)
     disallow_paths: list[str] = field(default_factory=list)
     crawl_delay: Optional[float] = None
+    # Per-pattern matching callables built from allow_paths/disallow_paths.
+    allow_matchers: list[Callable[[str], bool]] = field(default_factory=list)
+    disallow_matchers: list[Callable[[str], bool]] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.allow_paths and not self.allow_matchers:
+            self.allow_matchers = [_make_robots_matcher(p) for p in self.allow_paths]
+        if self.disallow_paths and not self.disallow_matchers:
+            self.disallow_matchers = [_make_robots_matcher(p) for p in self.disallow_paths]
+
+
+class RobotsDiskCache:
+    """
+    Small SQLite cache of robots.txt content shared across CLI runs.
+
+    Stores the raw content plus validator headers so repeat invocations can
+    skip the fetch entirely (within the TTL) or revalidate cheaply with
+    If-None-Match / If-Modified-Since. Any filesystem or SQLite error
+    disables the cache silently; robots handling then behaves as before.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 86400.0):
+        self.path = path or os.path.join(
+            os.path.expanduser('~'), '.cache', 'linkcanary', 'robots.db'
+        )
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._disabled:
+            return None
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._conn = sqlite3.connect(self.path)
+                self._conn.execute(
+                    'CREATE TABLE IF NOT EXISTS robots ('
+                    'domain TEXT PRIMARY KEY, content TEXT, etag TEXT, '
+                    'last_modified TEXT, fetched_at REAL)'
+                )
+                self._conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"robots disk cache disabled: {e}")
+                self._disabled = True
+                self._conn = None
+        return self._conn
+
+    def get(self, domain: str) -> Optional[tuple]:
+        """Return (content, etag, last_modified, fetched_at) or None."""
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                'SELECT content, etag, last_modified, fetched_at '
+                'FROM robots WHERE domain = ?', (domain,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row
+
+    def put(
+        self,
+        domain: str,
+        content: Optional[str],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO robots VALUES (?, ?, ?, ?, ?)',
+                (domain, content, etag, last_modified, time.time()),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def touch(self, domain: str) -> None:
+        """Refresh the fetched_at timestamp after a 304 revalidation."""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                'UPDATE robots SET fetched_at = ? WHERE domain = ?',
+                (time.time(), domain),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
 
 class RobotsTxtParser:
@@ -31,11 +183,24 @@ class RobotsTxtParser:
         self,
         user_agent: str = 'LinkCanary',
         timeout: int = 10,
+        disk_cache: Optional[RobotsDiskCache] = None,
+        cache_ttl: float = 86400.0,
     ):
         self.user_agent = user_agent.lower()
         self.timeout = timeout
+        # Lazily created on first fetch so constructing a parser (e.g. in
+        # tests, or when rules are injected) never touches the filesystem.
+        self._disk_cache = disk_cache
+        self._cache_ttl = cache_ttl
         self._cache: dict[str, list[RobotsRule]] = {}
+        # domain -> (rules list the result was computed from, applicable rules)
+        self._applicable_cache: dict[str, tuple[list[RobotsRule], list[RobotsRule]]] = {}
         self._fetched_domains: set[str] = set()
+        # Crawls re-check the same URL from many pages; memoize per parser
+        # instance so repeats skip the rule traversal.
+        self._is_allowed_cached = functools.lru_cache(maxsize=65536)(
+            self._compute_is_allowed
+        )
 
     def fetch_robots_txt(self, base_url: str) -> Optional[str]:
         """
@@ -48,20 +213,53 @@ class RobotsTxtParser:
             robots.txt content or None if not found
         """
         parsed = urlparse(base_url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        domain = f"{parsed.scheme}://{parsed.netloc}"
+        robots_url = f"{domain}/robots.txt"
+
+        if self._disk_cache is None and self._cache_ttl > 0:
+            self._disk_cache = RobotsDiskCache(ttl=self._cache_ttl)
+
+        cached = self._disk_cache.get(domain) if self._disk_cache else None
+        headers = {'User-Agent': self.user_agent}
+
+        if cached is not None:
+            content, etag, last_modified, fetched_at = cached
+            if time.time() - fetched_at < self._disk_cache.ttl:
+                logger.debug(f"robots.txt for {domain} served from disk cache")
+                return content
+            # Stale entry: revalidate cheaply when the server gave validators
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
 
         try:
             response = requests.get(
                 robots_url,
                 timeout=self.timeout,
-                headers={'User-Agent': self.user_agent},
+                headers=headers,
             )
 
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"robots.txt for {domain} revalidated (304)")
+                if self._disk_cache:
+                    self._disk_cache.touch(domain)
+                return cached[0]
+
             if response.status_code == 200:
                 logger.info(f"Found robots.txt at {robots_url}")
+                if self._disk_cache:
+                    self._disk_cache.put(
+                        domain,
+                        response.text,
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'),
+                    )
                 return response.text
             else:
                 logger.debug(f"No robots.txt at {robots_url} (status: {response.status_code})")
+                if self._disk_cache:
+                    self._disk_cache.put(domain, None)
                 return None
 
         except requests.RequestException as e:
@@ -105,8 +303,10 @@ class RobotsTxtParser:
             elif current_rule:
                 if directive == 'allow':
                     current_rule.allow_paths.append(value)
+                    current_rule.allow_matchers.append(_make_robots_matcher(value))
                 elif directive == 'disallow':
                     current_rule.disallow_paths.append(value)
+                    current_rule.disallow_matchers.append(_make_robots_matcher(value))
                 elif directive == 'crawl-delay':
                     try:
                         current_rule.crawl_delay = float(value)
@@ -142,6 +342,36 @@ class RobotsTxtParser:
 
         return self._cache.get(domain, [])
 
+    def _get_applicable_rules(
+        self,
+        base_url: str,
+        rules: list[RobotsRule],
+    ) -> list[RobotsRule]:
+        """
+        Get the rules that apply to our user-agent, most specific first.
+
+        The ordered list is computed once per domain and cached; the
+        per-URL is_allowed path then just iterates it. The cache entry is
+        invalidated when the underlying rules list changes.
+        """
+        parsed = urlparse(base_url)
+        domain = f"{parsed.scheme}://{parsed.netloc}"
+
+        cached = self._applicable_cache.get(domain)
+        if cached is not None and cached[0] is rules:
+            return cached[1]
+
+        applicable_rules = []
+        for rule in rules:
+            # Check if rule applies to our user-agent
+            if rule.user_agent == '*':
+                applicable_rules.append(rule)
+            elif self.user_agent in rule.user_agent or rule.user_agent in self.user_agent:
+                applicable_rules.insert(0, rule)  # More specific rules first
+
+        self._applicable_cache[domain] = (rules, applicable_rules)
+        return applicable_rules
+
     def _matches_pattern(self, path: str, pattern: str) -> bool:
         """
         Check if a path matches a robots.txt pattern.
@@ -157,32 +387,7 @@ class RobotsTxtParser:
         Returns:
             True if path matches pattern
         """
-        if pattern == '/':
-            return True
-
-        # Handle wildcards
-        if '*' in pattern or '$' in pattern:
-            # Convert robots.txt pattern to regex-like matching
-            import re
-            # Escape special regex chars except * and $
-            regex_pattern = ''
-            for char in pattern:
-                if char == '*':
-                    regex_pattern += '.*'
-                elif char == '$':
-                    regex_pattern += '$'
-                elif char in '.^+?{}[]|()\\':
-                    regex_pattern += '\\' + char
-                else:
-                    regex_pattern += char
-
-            if not regex_pattern.endswith('$'):
-                regex_pattern += '.*'
-
-            return bool(re.match(regex_pattern, path))
-
-        # Simple prefix match
-        return path.startswith(pattern)
+        return _make_robots_matcher(pattern)(path)
 
     def is_allowed(self, url: str, base_url: str) -> tuple[bool, str]:
         """
@@ -195,6 +400,10 @@ class RobotsTxtParser:
         Returns:
             Tuple of (is_allowed, reason)
         """
+        return self._is_allowed_cached(url, base_url)
+
+    def _compute_is_allowed(self, url: str, base_url: str) -> tuple[bool, str]:
+        """Uncached matching core behind is_allowed."""
         rules = self.get_rules_for_domain(base_url)
 
         if not rules:
@@ -205,14 +414,7 @@ class RobotsTxtParser:
         if parsed.query:
             path += '?' + parsed.query
 
-        # Find applicable rules (most specific user-agent match)
-        applicable_rules = []
-        for rule in rules:
-            # Check if rule applies to our user-agent
-            if rule.user_agent == '*':
-                applicable_rules.append(rule)
-            elif self.user_agent in rule.user_agent or rule.user_agent in self.user_agent:
-                applicable_rules.insert(0, rule)  # More specific rules first
+        applicable_rules = self._get_applicable_rules(base_url, rules)
 
         # If no applicable rules, allowed
         if not applicable_rules:
@@ -220,14 +422,27 @@ class RobotsTxtParser:
 
         # Check rules in order (most specific first)
         for rule in applicable_rules:
+            # Guard against rules mutated after construction, where the
+            # matcher lists may have fallen out of sync with the paths.
+            allow_matchers = (
+                rule.allow_matchers
+                if len(rule.allow_matchers) == len(rule.allow_paths)
+                else [_make_robots_matcher(p) for p in rule.allow_paths]
+            )
+            disallow_matchers = (
+                rule.disallow_matchers
+                if len(rule.disallow_matchers) == len(rule.disallow_paths)
+                else [_make_robots_matcher(p) for p in rule.disallow_paths]
+            )
+
             # Check Allow directives first (they take precedence)
-            for allow_pattern in rule.allow_paths:
-                if self._matches_pattern(path, allow_pattern):
+            for allow_pattern, matcher in zip(rule.allow_paths, allow_matchers):
+                if matcher(path):
                     return True, f"allowed by pattern: {allow_pattern}"
 
             # Check Disallow directives
-            for disallow_pattern in rule.disallow_paths:
-                if disallow_pattern and self._matches_pattern(path, disallow_pattern):
+            for disallow_pattern, matcher in zip(rule.disallow_paths, disallow_matchers):
+                if disallow_pattern and matcher(path):
                     return False, f"disallowed by pattern: {disallow_pattern}"
 
         return True, "no matching disallow rules"
@@ -308,11 +523,12 @@ class RobotsComplianceChecker:
         if self.ignore_robots:
             return urls, {}
 
-        allowed = []
-        for url in urls:
-            is_allowed, reason = self.check_url(url, base_url)
-            if is_allowed:
-                allowed.append(url)
+        # Decide each unique URL once; duplicates reuse the decision.
+        decisions = {
+            url: self.check_url(url, base_url)[0]
+            for url in dict.fromkeys(urls)
+        }
+        allowed = [url for url in urls if decisions[url]]
 
         return allowed, self._skipped_urls
 
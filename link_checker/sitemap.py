@@ -1,13 +1,36 @@
 """Sitemap parsing module."""
 
 import gzip
+import io
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from io import BytesIO
 from typing import Optional
 from xml.etree import ElementTree as ET
 
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
 
 logger = logging.getLogger(__name__)
 
@@ -15,103 +38,350 @@ SITEMAP_NS = {
     'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9',
 }
 
+_SM_URI = SITEMAP_NS['sm']
+_NS_LOC = f'{{{_SM_URI}}}loc'
+_NS_LASTMOD = f'{{{_SM_URI}}}lastmod'
+_GZIP_MAGIC = b'\x1f\x8b'
+
+_LASTMOD_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%dT%H:%M:%S.%f%z',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%d',
+)
+
+
+@lru_cache(maxsize=10_000)
+def _parse_lastmod_value(lastmod_str: str) -> Optional[datetime]:
+    """
+    Parse a W3C-DTF lastmod string.
+
+    Uses ciso8601's C parser when installed (it handles every sitemaps.org
+    date form directly); otherwise falls back to the strptime format loop.
+    Cached because large sitemaps repeat identical timestamps across URLs.
+    """
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(lastmod_str)
+        except ValueError:
+            pass
+
+    munged = lastmod_str.replace('+00:00', 'Z').replace('Z', '+0000')
+
+    for fmt in _LASTMOD_FORMATS:
+        try:
+            return datetime.strptime(munged, fmt)
+        except ValueError:
+            continue
+
+    logger.debug(f"Could not parse lastmod date: {lastmod_str}")
+    return None
+# Both namespaced and bare forms occur in the wild.
+_ITERPARSE_TAGS = (
+    f'{{{_SM_URI}}}url', 'url',
+    f'{{{_SM_URI}}}sitemap', 'sitemap',
+)
+
+
+class _GzipStream(gzip.GzipFile):
+    """GzipFile that also closes the underlying response stream."""
+
+    def close(self):
+        fileobj = self.fileobj
+        try:
+            super().close()
+        finally:
+            if fileobj is not None:
+                fileobj.close()
+
+
+class _OwningStream:
+    """Wrap a decompressor so closing it also closes its source stream."""
+
+    def __init__(self, inner, source):
+        self._inner = inner
+        self._source = source
+
+    def close(self):
+        try:
+            self._inner.close()
+        finally:
+            self._source.close()
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+# Decompression threads for rapidgzip on large .gz sitemaps.
+_GZIP_PARALLELISM = 4
+
+
+def _open_gzip_stream(fileobj):
+    """
+    Open a gzip-compressed stream for reading.
+
+    Prefers rapidgzip's multithreaded decompressor when installed, which
+    parallelizes inflation of large compressed sitemaps across cores;
+    otherwise stdlib gzip. Either way the returned object closes the
+    underlying stream with itself.
+    """
+    if rapidgzip is not None:
+        try:
+            inner = rapidgzip.open(fileobj, parallelization=_GZIP_PARALLELISM)
+            return _OwningStream(inner, fileobj)
+        except Exception as e:
+            logger.debug(f"rapidgzip decompression unavailable: {e}")
+
+    return _GzipStream(fileobj=fileobj)
+
 
 class SitemapParser:
     """Parser for XML sitemaps and sitemap indexes."""
-    
+
+    # Concurrency for child sitemaps of an index, and a guard against
+    # maliciously or accidentally self-referencing nested indexes.
+    INDEX_WORKERS = 8
+    MAX_INDEX_DEPTH = 5
+
     def __init__(
         self,
         user_agent: str = 'LinkCanary/1.0',
         timeout: int = 30,
+        use_cache: bool = False,
     ):
         self.user_agent = user_agent
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = self._make_session(use_cache)
         self.session.headers.update({
             'User-Agent': self.user_agent,
             'Accept': 'application/xml, text/xml, */*',
         })
-    
-    def fetch_sitemap(self, url: str) -> Optional[bytes]:
-        """Fetch sitemap content from URL."""
+        # Sized connection pool with keep-alive: a sitemap index fans out
+        # many fetches to the same host, which otherwise each pay a fresh
+        # TCP+TLS handshake.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @staticmethod
+    def _make_session(use_cache: bool) -> requests.Session:
+        """
+        Build the HTTP session, optionally backed by an on-disk cache.
+
+        With requests-cache installed and use_cache on, repeat crawls of
+        the same site turn sitemap downloads into conditional GETs:
+        cache_control honors the server's ETag/Last-Modified, so an
+        unchanged sitemap costs a 304 instead of the full payload. Falls
+        back to a plain session when the package is missing.
+        """
+        if use_cache and requests_cache is not None:
+            cache_path = os.path.join(
+                os.path.expanduser('~'), '.cache', 'linkcanary', 'sitemap_cache'
+            )
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                return requests_cache.CachedSession(
+                    cache_path,
+                    backend='sqlite',
+                    expire_after=3600,
+                    cache_control=True,
+                    stale_if_error=True,
+                )
+            except Exception as e:
+                logger.debug(f"sitemap HTTP cache disabled: {e}")
+
+        return requests.Session()
+
+    def fetch_sitemap(self, url: str) -> Optional[io.BufferedIOBase]:
+        """
+        Open a sitemap URL as a binary stream.
+
+        Returns a file-like object decompressed on the fly, so the parser
+        starts consuming bytes while the download is still in flight and
+        the payload is never buffered whole. The caller owns closing it.
+        """
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, stream=True, timeout=self.timeout)
             response.raise_for_status()
-            
-            if url.endswith('.gz') or response.headers.get('Content-Encoding') == 'gzip':
-                try:
-                    return gzip.decompress(response.content)
-                except gzip.BadGzipFile:
-                    return response.content
-            
-            return response.content
         except requests.RequestException as e:
             logger.error(f"Failed to fetch sitemap {url}: {e}")
             return None
+
+        # Transparent Content-Encoding handling stays with urllib3. Keep
+        # the stream open at EOF (plain b'' reads) so the parser sees a
+        # normal end-of-file instead of a closed-file error.
+        response.raw.decode_content = True
+        response.raw.auto_close = False
+        stream = io.BufferedReader(response.raw)
+
+        # .gz sitemaps arrive compressed regardless of Content-Encoding;
+        # sniff the magic bytes so a mislabeled plain file still parses.
+        if url.endswith('.gz') and stream.peek(2)[:2] == _GZIP_MAGIC:
+            return _open_gzip_stream(stream)
+
+        return stream
     
     def parse_sitemap(
         self,
         url: str,
         since: Optional[datetime] = None,
+        _depth: int = 0,
     ) -> list[str]:
         """
         Parse a sitemap and return list of page URLs.
-        
+
         Handles both regular sitemaps and sitemap indexes.
-        
+
         Args:
             url: URL to the sitemap
             since: Optional datetime to filter pages by lastmod
-        
+
         Returns:
             List of page URLs
         """
-        content = self.fetch_sitemap(url)
-        if not content:
+        stream = self.fetch_sitemap(url)
+        if stream is None:
             return []
-        
+
         try:
-            root = ET.fromstring(content)
-        except ET.ParseError as e:
-            logger.error(f"Failed to parse sitemap XML from {url}: {e}")
+            urls, nested_sitemaps = self._iterparse_sitemap(stream, url, since)
+        finally:
+            stream.close()
+
+        urls.extend(self._fetch_nested_sitemaps(nested_sitemaps, since, _depth))
+        return urls
+
+    def _fetch_nested_sitemaps(
+        self,
+        nested_sitemaps: list[str],
+        since: Optional[datetime],
+        depth: int,
+    ) -> list[str]:
+        """
+        Fetch and parse the child sitemaps of an index, in parallel.
+
+        Children are fetched concurrently over the session's connection
+        pool, so an index with N children costs ~ceil(N/workers) round
+        trips instead of N. A depth limit stops runaway recursion on
+        pathological indexes that reference each other.
+        """
+        if not nested_sitemaps:
             return []
-        
-        tag_name = root.tag.split('}')[-1] if '}' in root.tag else root.tag
-        
-        if tag_name == 'sitemapindex':
-            return self._parse_sitemap_index(root, since)
-        elif tag_name == 'urlset':
-            return self._parse_urlset(root, since)
-        else:
-            logger.warning(f"Unknown sitemap root element: {tag_name}")
+
+        if depth >= self.MAX_INDEX_DEPTH:
+            logger.warning(
+                f"Sitemap index nesting exceeds {self.MAX_INDEX_DEPTH} levels; "
+                f"skipping {len(nested_sitemaps)} nested sitemap(s)"
+            )
             return []
-    
-    def _parse_sitemap_index(
+
+        for sitemap_url in nested_sitemaps:
+            logger.info(f"Found nested sitemap: {sitemap_url}")
+
+        if len(nested_sitemaps) == 1:
+            return self.parse_sitemap(nested_sitemaps[0], since, _depth=depth + 1)
+
+        urls = []
+        workers = min(self.INDEX_WORKERS, len(nested_sitemaps))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for nested_urls in executor.map(
+                lambda u: self.parse_sitemap(u, since, _depth=depth + 1),
+                nested_sitemaps,
+            ):
+                urls.extend(nested_urls)
+
+        return urls
+
+    def parse_sitemap_content(
         self,
-        root: ET.Element,
+        content: bytes,
         since: Optional[datetime] = None,
+        source_url: str = '<content>',
     ) -> list[str]:
-        """Parse a sitemap index and recursively fetch all referenced sitemaps."""
-        urls = []
-        
-        for sitemap in root.findall('sm:sitemap', SITEMAP_NS):
-            loc = sitemap.find('sm:loc', SITEMAP_NS)
-            if loc is not None and loc.text:
-                sitemap_url = loc.text.strip()
-                logger.info(f"Found nested sitemap: {sitemap_url}")
-                nested_urls = self.parse_sitemap(sitemap_url, since)
-                urls.extend(nested_urls)
-        
-        for sitemap in root.findall('sitemap'):
-            loc = sitemap.find('loc')
-            if loc is not None and loc.text:
-                sitemap_url = loc.text.strip()
-                logger.info(f"Found nested sitemap: {sitemap_url}")
-                nested_urls = self.parse_sitemap(sitemap_url, since)
-                urls.extend(nested_urls)
-        
+        """
+        Parse sitemap content the caller already fetched.
+
+        Same handling as parse_sitemap (gzip sniffing, sitemap indexes with
+        nested fetches, lastmod filtering) for callers that bring their own
+        HTTP client.
+
+        Args:
+            content: Raw sitemap bytes, optionally gzip-compressed
+            since: Optional datetime to filter pages by lastmod
+            source_url: URL the content came from, for log messages
+
+        Returns:
+            List of page URLs
+        """
+        if content[:2] == _GZIP_MAGIC:
+            stream = _open_gzip_stream(io.BytesIO(content))
+        else:
+            stream = io.BytesIO(content)
+
+        urls, nested_sitemaps = self._iterparse_sitemap(stream, source_url, since)
+        urls.extend(self._fetch_nested_sitemaps(nested_sitemaps, since, 0))
         return urls
-    
+
+    def _iterparse_sitemap(
+        self,
+        stream,
+        url: str,
+        since: Optional[datetime] = None,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Stream-parse a sitemap, returning (page_urls, nested_sitemap_urls).
+
+        Uses lxml's iterparse so <url>/<sitemap> elements are extracted and
+        freed one at a time; RSS stays flat no matter how large the sitemap
+        is, and libxml2 parses several times faster than ElementTree.
+        """
+        urls = []
+        nested = []
+
+        try:
+            for _, elem in etree.iterparse(
+                stream, events=('end',), tag=_ITERPARSE_TAGS,
+            ):
+                # Children share the element's namespace; picking the tag
+                # form once avoids a second lookup per element.
+                namespaced = elem.tag[0] == '{'
+                loc = elem.findtext(_NS_LOC if namespaced else 'loc')
+                if loc and loc.strip():
+                    loc = loc.strip()
+                    if elem.tag.endswith('sitemap'):
+                        nested.append(loc)
+                    else:
+                        lastmod_text = elem.findtext(
+                            _NS_LASTMOD if namespaced else 'lastmod'
+                        )
+                        lastmod = (
+                            self._parse_lastmod(lastmod_text.strip())
+                            if lastmod_text else None
+                        )
+                        if self._should_include(lastmod, since):
+                            urls.append(loc)
+
+                # Free the element and any already-consumed siblings.
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        except (etree.XMLSyntaxError, OSError) as e:
+            logger.error(f"Failed to parse sitemap XML from {url}: {e}")
+            return [], []
+
+        return urls, nested
+
     def _parse_urlset(
         self,
         root: ET.Element,
@@ -119,21 +389,30 @@ class SitemapParser:
     ) -> list[str]:
         """Parse a urlset and extract page URLs."""
         urls = []
-        
-        for url_elem in root.findall('sm:url', SITEMAP_NS):
-            url_data = self._parse_url_element(url_elem, SITEMAP_NS)
-            if url_data:
-                loc, lastmod = url_data
-                if self._should_include(lastmod, since):
-                    urls.append(loc)
-        
-        for url_elem in root.findall('url'):
-            url_data = self._parse_url_element(url_elem, {})
-            if url_data:
-                loc, lastmod = url_data
-                if self._should_include(lastmod, since):
-                    urls.append(loc)
-        
+
+        # Children share the root's namespace: detect it once and walk the
+        # tree a single time instead of one findall pass per namespace form.
+        if root.tag.startswith('{'):
+            ns_uri = root.tag.split('}', 1)[0][1:]
+            url_tag = f'{{{ns_uri}}}url'
+            loc_tag = f'{{{ns_uri}}}loc'
+            lastmod_tag = f'{{{ns_uri}}}lastmod'
+        else:
+            url_tag, loc_tag, lastmod_tag = 'url', 'loc', 'lastmod'
+
+        for url_elem in root.iter(url_tag):
+            loc = url_elem.findtext(loc_tag)
+            if not loc or not loc.strip():
+                continue
+
+            lastmod_text = url_elem.findtext(lastmod_tag)
+            lastmod = (
+                self._parse_lastmod(lastmod_text.strip())
+                if lastmod_text and lastmod_text.strip() else None
+            )
+            if self._should_include(lastmod, since):
+                urls.append(loc.strip())
+
         return urls
     
     def _parse_url_element(
@@ -162,24 +441,7 @@ class SitemapParser:
     
     def _parse_lastmod(self, lastmod_str: str) -> Optional[datetime]:
         """Parse a lastmod date string."""
-        formats = [
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%dT%H:%M:%S.%f%z',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%d',
-        ]
-        
-        lastmod_str = lastmod_str.replace('+00:00', 'Z').replace('Z', '+0000')
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(lastmod_str, fmt)
-            except ValueError:
-                continue
-        
-        logger.debug(f"Could not parse lastmod date: {lastmod_str}")
-        return None
+        return _parse_lastmod_value(lastmod_str)
     
     def _should_include(
         self,
@@ -210,3 +472,53 @@ class SitemapParser:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
         return False
+
+
+# Pool of shared parsers, least recently used first. An explicit pool
+# rather than lru_cache because eviction must close the parser's pooled
+# session (lru_cache drops entries without running any destructor), and
+# the key includes caller-supplied values like user_agent.
+_parser_pool: 'OrderedDict[tuple, SitemapParser]' = OrderedDict()
+_parser_pool_lock = threading.Lock()
+_PARSER_POOL_SIZE = 8
+
+
+def get_sitemap_parser(
+    user_agent: str = 'LinkCanary/1.0',
+    timeout: int = 30,
+    use_cache: bool = False,
+) -> SitemapParser:
+    """Process-lifetime SitemapParser shared across calls.
+
+    Long-running callers (the web UI, the crawl worker) hit the same
+    sitemaps repeatedly; reusing one parser per settings combination
+    keeps its session's TCP/TLS connections warm instead of paying a
+    fresh handshake per request. Callers must not close the returned
+    parser; the pool owns it and closes it when the entry is evicted.
+    """
+    key = (user_agent, timeout, use_cache)
+    evicted = []
+
+    with _parser_pool_lock:
+        parser = _parser_pool.get(key)
+        if parser is not None:
+            _parser_pool.move_to_end(key)
+            return parser
+
+        parser = SitemapParser(
+            user_agent=user_agent,
+            timeout=timeout,
+            use_cache=use_cache,
+        )
+        _parser_pool[key] = parser
+        while len(_parser_pool) > _PARSER_POOL_SIZE:
+            _, old = _parser_pool.popitem(last=False)
+            evicted.append(old)
+
+    # Closing outside the lock; close() only drops the session's idle
+    # pooled connections, so a caller still mid-parse on an evicted
+    # parser keeps working (on fresh connections).
+    for old in evicted:
+        old.close()
+
+    return parser
@@ -1,9 +1,26 @@
 """URL normalization and utility functions."""
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse, unquote, urlencode, parse_qsl
 
+# The same URLs pass through these helpers thousands of times per crawl
+# (the base URL on every internality check, repeated link URLs across
+# pages), so the hot pure-string functions are memoized. Inputs are
+# plain strings, so caching is safe; the maxsize caps bound memory.
+_urlparse_cached = lru_cache(maxsize=200_000)(urlparse)
 
+
+def _strip_default_port(netloc: str, scheme: str) -> str:
+    """Remove the scheme's default port (:80 http, :443 https) from a netloc."""
+    if scheme == 'http':
+        return netloc.removesuffix(':80')
+    if scheme == 'https':
+        return netloc.removesuffix(':443')
+    return netloc
+
+
+@lru_cache(maxsize=200_000)
 def normalize_url(url: str) -> str:
     """
     Normalize a URL for consistent comparison and deduplication.
@@ -20,21 +37,17 @@ def normalize_url(url: str) -> str:
         return url
     
     try:
-        parsed = urlparse(url)
+        parsed = _urlparse_cached(url)
     except Exception:
         return url
     
     scheme = parsed.scheme.lower()
     netloc = parsed.netloc.lower()
     
-    if netloc.endswith(':80') and scheme == 'http':
-        netloc = netloc[:-3]
-    elif netloc.endswith(':443') and scheme == 'https':
-        netloc = netloc[:-4]
+    netloc = _strip_default_port(netloc, scheme)
     
     path = unquote(parsed.path)
-    path = re.sub(r'%([0-9A-Fa-f]{2})', lambda m: chr(int(m.group(1), 16)), path)
-    
+
     if parsed.query:
         query_params = parse_qsl(parsed.query, keep_blank_values=True)
         query_params.sort(key=lambda x: x[0])
@@ -60,14 +73,14 @@ def is_canonical_redirect(source_url: str, dest_url: str) -> bool:
         return False
     
     try:
-        source = urlparse(source_url)
-        dest = urlparse(dest_url)
+        source = _urlparse_cached(source_url)
+        dest = _urlparse_cached(dest_url)
     except Exception:
         return False
     
-    source_host = source.netloc.lower().rstrip(':80').rstrip(':443')
-    dest_host = dest.netloc.lower().rstrip(':80').rstrip(':443')
-    
+    source_host = _strip_default_port(source.netloc.lower(), source.scheme.lower())
+    dest_host = _strip_default_port(dest.netloc.lower(), dest.scheme.lower())
+
     if source_host != dest_host:
         return False
     
@@ -89,19 +102,25 @@ def is_canonical_redirect(source_url: str, dest_url: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=200_000)
 def get_domain(url: str) -> str:
     """Extract the domain (netloc) from a URL."""
     try:
-        parsed = urlparse(url)
+        parsed = _urlparse_cached(url)
         return parsed.netloc.lower()
     except Exception:
         return ''
 
 
+# Two-label public suffixes where the registrable domain spans three labels.
+_COMMON_TLDS = frozenset({'co.uk', 'com.au', 'co.nz', 'co.za', 'com.br', 'co.jp', 'co.kr'})
+
+
+@lru_cache(maxsize=200_000)
 def get_root_domain(url: str) -> str:
     """
     Extract the root domain from a URL.
-    
+
     Examples:
     - blog.example.com -> example.com
     - www.example.co.uk -> example.co.uk
@@ -109,22 +128,24 @@ def get_root_domain(url: str) -> str:
     domain = get_domain(url)
     if not domain:
         return ''
-    
-    domain = domain.split(':')[0]
-    
-    parts = domain.split('.')
-    
-    if len(parts) <= 2:
+
+    domain = domain.partition(':')[0]
+
+    # Index math on the last two dots instead of split + join: no list of
+    # label strings per call on this per-link hot path.
+    last_dot = domain.rfind('.')
+    if last_dot == -1:
         return domain
-    
-    common_tlds = {'co.uk', 'com.au', 'co.nz', 'co.za', 'com.br', 'co.jp', 'co.kr'}
-    
-    if len(parts) >= 3:
-        potential_tld = '.'.join(parts[-2:])
-        if potential_tld in common_tlds:
-            return '.'.join(parts[-3:])
-    
-    return '.'.join(parts[-2:])
+
+    second_dot = domain.rfind('.', 0, last_dot)
+    if second_dot == -1:
+        return domain
+
+    if domain[second_dot + 1:] in _COMMON_TLDS:
+        third_dot = domain.rfind('.', 0, second_dot)
+        return domain[third_dot + 1:]
+
+    return domain[second_dot + 1:]
 
 
 def is_internal_link(link_url: str, base_url: str, include_subdomains: bool = False) -> bool:
@@ -159,40 +180,39 @@ def is_internal_link(link_url: str, base_url: str, include_subdomains: bool = Fa
     return False
 
 
+@lru_cache(maxsize=200_000)
 def is_valid_http_url(url: str) -> bool:
     """Check if a URL is a valid HTTP/HTTPS URL."""
     if not url:
         return False
     
     try:
-        parsed = urlparse(url)
+        parsed = _urlparse_cached(url)
         return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
     except Exception:
         return False
 
 
+# Anchors and non-HTTP schemes, as one case-insensitive prefix test:
+# a single pattern walk replaces strip(), lower() and seven startswith
+# probes per href.
+_SKIP_LINK_RE = re.compile(
+    r'^\s*(?:#|(?:mailto|tel|javascript|data|file|ftp|ssh):)',
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=200_000)
 def should_skip_link(href: str) -> bool:
     """
     Determine if a link should be skipped (non-HTTP links).
-    
+
     Skips: mailto:, tel:, javascript:, #anchors, data:, file:
     """
     if not href:
         return True
-    
-    href = href.strip()
-    
-    if href.startswith('#'):
-        return True
-    
-    skip_schemes = ('mailto:', 'tel:', 'javascript:', 'data:', 'file:', 'ftp:', 'ssh:')
-    href_lower = href.lower()
-    
-    for scheme in skip_schemes:
-        if href_lower.startswith(scheme):
-            return True
-    
-    return False
+
+    return _SKIP_LINK_RE.match(href) is not None
 
 
 def resolve_relative_url(base_url: str, relative_url: str) -> str:
@@ -1,12 +1,17 @@
 """Crawl API endpoints."""
 
 import csv
+import json
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, select
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Crawl, CrawlStatus, get_db
@@ -22,11 +27,37 @@ from ..models.schemas import (
     ValidateSitemapResponse,
 )
 from ..storage import get_storage
-from ..tasks.crawl_task import run_crawl_in_background
+from ..tasks.crawl_task import run_crawl_in_background, stop_crawl_task
 
 router = APIRouter(prefix="/api/crawls", tags=["crawls"])
 
 
+def _build_validate_client() -> httpx.AsyncClient:
+    """Pooled async client shared by sitemap validations.
+
+    Async so validations yield the event loop during I/O instead of
+    stalling the worker; HTTP/2 multiplexing is used when the optional
+    h2 package is installed.
+    """
+    kwargs = dict(
+        timeout=15.0,
+        follow_redirects=True,
+        headers={"User-Agent": "LinkCanary/1.0"},
+    )
+    try:
+        return httpx.AsyncClient(http2=True, **kwargs)
+    except ImportError:
+        return httpx.AsyncClient(**kwargs)
+
+
+_validate_client = _build_validate_client()
+
+
+async def aclose_validate_client():
+    """Close the shared validation client (app shutdown hook)."""
+    await _validate_client.aclose()
+
+
 def extract_domain(url: str) -> str:
     """Extract domain from URL for crawl name."""
     parsed = urlparse(url)
@@ -83,28 +114,53 @@ async def list_crawls(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     status: Optional[str] = None,
+    cursor: Optional[datetime] = Query(None),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all crawls."""
+    """
+    List all crawls.
+
+    Pass the returned next_cursor back as ?cursor= to page with keyset
+    pagination: each page is a ranged index scan, so latency stays flat
+    no matter how deep the caller pages, unlike ?skip= which walks and
+    discards every skipped row. Cursor requests skip the COUNT query
+    unless include_total is set.
+    """
     query = select(Crawl).order_by(desc(Crawl.created_at))
-    
+    count_stmt = select(func.count()).select_from(Crawl)
+
     if status:
         try:
             status_enum = CrawlStatus(status)
             query = query.where(Crawl.status == status_enum)
+            count_stmt = count_stmt.where(Crawl.status == status_enum)
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
-    
-    count_result = await db.execute(select(Crawl))
-    total = len(count_result.scalars().all())
-    
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
+
+    if cursor is not None:
+        query = query.where(Crawl.created_at < cursor)
+    else:
+        query = query.offset(skip)
+
+    # Fetch one extra row to learn whether another page exists.
+    result = await db.execute(query.limit(limit + 1))
     crawls = result.scalars().all()
-    
+
+    next_cursor = None
+    if len(crawls) > limit:
+        crawls = crawls[:limit]
+        next_cursor = crawls[-1].created_at
+
+    total = None
+    if include_total or cursor is None:
+        # Count on the database instead of materializing every row.
+        total = (await db.execute(count_stmt)).scalar_one()
+
     return CrawlListResponse(
         crawls=[CrawlResponse(**c.to_dict()) for c in crawls],
         total=total,
+        next_cursor=next_cursor,
     )
 
 
@@ -159,7 +215,11 @@ async def stop_crawl(
     crawl.status = CrawlStatus.CANCELLED
     crawl.completed_at = datetime.utcnow()
     await db.commit()
-    
+
+    # Wake the in-process worker immediately; the committed status above
+    # covers workers in other processes via their periodic poll.
+    stop_crawl_task(crawl_id)
+
     return {"message": "Crawl stopped"}
 
 
@@ -208,45 +268,114 @@ async def get_report(
     """Get report data as JSON."""
     result = await db.execute(select(Crawl).where(Crawl.id == crawl_id))
     crawl = result.scalar_one_or_none()
-    
+
     if not crawl:
         raise HTTPException(status_code=404, detail="Crawl not found")
-    
+
     if not crawl.report_csv_path:
         raise HTTPException(status_code=404, detail="Report not available")
-    
-    issues = []
+
+    path = get_storage().localize(crawl.report_csv_path)
     try:
-        with open(get_storage().localize(crawl.report_csv_path), newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                example_pages = row.get('example_pages', '')
-                issues.append(ReportIssue(
-                    source_page=row.get('source_page', ''),
-                    occurrence_count=int(row.get('occurrence_count', 1)),
-                    example_pages=example_pages.split('|') if example_pages else [],
-                    link_url=row.get('link_url', ''),
-                    link_text=row.get('link_text', ''),
-                    link_type=row.get('link_type', ''),
-                    element_type=row.get('element_type', 'a'),
-                    status_code=int(row.get('status_code', 0)),
-                    issue_type=row.get('issue_type', ''),
-                    priority=row.get('priority', ''),
-                    redirect_chain=row.get('redirect_chain') or None,
-                    final_url=row.get('final_url') or None,
-                    recommended_fix=row.get('recommended_fix', ''),
-                    response_time_ms=float(row['response_time_ms']) if row.get('response_time_ms') else None,
-                    anchor_quality=row.get('anchor_quality', ''),
-                ))
+        # The CSV read is blocking; keep it off the event loop.
+        issues = await run_in_threadpool(_read_report_issues, path)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Report file not found")
-    
+
     return ReportResponse(
         crawl_id=crawl_id,
         issues=issues,
         total=len(issues),
     )
 
+
+# Batch adapter: compiles the ReportIssue schema once and validates whole
+# row lists in a single core call, which is noticeably faster than
+# constructing models one by one for 100k-row reports.
+_REPORT_ADAPTER = TypeAdapter(list[ReportIssue])
+
+
+def _report_row_to_fields(row: dict) -> dict:
+    """Map one CSV row to ReportIssue field values."""
+    example_pages = row.get('example_pages', '')
+    return {
+        'source_page': row.get('source_page', ''),
+        'occurrence_count': int(row.get('occurrence_count', 1)),
+        'example_pages': example_pages.split('|') if example_pages else [],
+        'link_url': row.get('link_url', ''),
+        'link_text': row.get('link_text', ''),
+        'link_type': row.get('link_type', ''),
+        'element_type': row.get('element_type', 'a'),
+        'status_code': int(row.get('status_code', 0)),
+        'issue_type': row.get('issue_type', ''),
+        'priority': row.get('priority', ''),
+        'redirect_chain': row.get('redirect_chain') or None,
+        'final_url': row.get('final_url') or None,
+        'recommended_fix': row.get('recommended_fix', ''),
+        'response_time_ms': float(row['response_time_ms']) if row.get('response_time_ms') else None,
+        'anchor_quality': row.get('anchor_quality', ''),
+    }
+
+
+def _report_issue_from_row(row: dict) -> ReportIssue:
+    """Build a ReportIssue from one CSV row."""
+    return ReportIssue(**_report_row_to_fields(row))
+
+
+def _read_report_issues(path: str) -> list[ReportIssue]:
+    """Read a full report CSV into ReportIssue objects."""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = [_report_row_to_fields(row) for row in csv.DictReader(f)]
+    return _REPORT_ADAPTER.validate_python(rows)
+
+
+def _count_report_rows(path: str) -> int:
+    """Count data rows of a report CSV (header excluded)."""
+    with open(path, newline='', encoding='utf-8') as f:
+        return max(sum(1 for _ in f) - 1, 0)
+
+
+@router.get("/{crawl_id}/report/stream")
+async def stream_report(
+    crawl_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream report rows as newline-delimited JSON.
+
+    Unlike /report, which builds the entire issue list in memory, this
+    yields one JSON line per CSV row so peak memory stays flat and the
+    client sees first bytes immediately on large reports. The row count
+    is exposed in an X-Total-Rows header for progress display.
+    """
+    result = await db.execute(select(Crawl).where(Crawl.id == crawl_id))
+    crawl = result.scalar_one_or_none()
+
+    if not crawl:
+        raise HTTPException(status_code=404, detail="Crawl not found")
+
+    if not crawl.report_csv_path:
+        raise HTTPException(status_code=404, detail="Report not available")
+
+    path = get_storage().localize(crawl.report_csv_path)
+    try:
+        total = await run_in_threadpool(_count_report_rows, path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Report file not found")
+
+    def issue_lines():
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                yield json.dumps(_report_issue_from_row(row).model_dump()) + '\n'
+
+    # Sync generators are iterated in Starlette's threadpool, so the
+    # blocking reads never touch the event loop.
+    return StreamingResponse(
+        issue_lines(),
+        media_type='application/x-ndjson',
+        headers={'X-Total-Rows': str(total)},
+    )
+
 @router.get("/{crawl_id}/transparency", response_model=CrawlTransparencyResponse)
 async def get_transparency(
     crawl_id: str,
@@ -397,48 +526,43 @@ async def get_shared_report(
 @router.post("/validate-sitemap", response_model=ValidateSitemapResponse)
 async def validate_sitemap(request: ValidateSitemapRequest):
     """Validate that a sitemap URL is accessible."""
-    import requests
-    
     url = normalize_sitemap_url(request.url)
-    
+
     try:
-        response = requests.head(
-            url,
-            timeout=10,
-            headers={"User-Agent": "LinkCanary/1.0"},
-            allow_redirects=True,
-        )
-        
+        # One GET does it: status check and content for the parser. The
+        # shared async client yields the loop while waiting on the server.
+        response = await _validate_client.get(url)
+
         if response.status_code != 200:
             return ValidateSitemapResponse(
                 valid=False,
+                page_count=None,
                 error=f"HTTP {response.status_code}",
             )
-        
-        response = requests.get(
-            url,
-            timeout=15,
-            headers={"User-Agent": "LinkCanary/1.0"},
-        )
-        
-        from link_checker.sitemap import SitemapParser
-        parser = SitemapParser()
+
+        from link_checker.sitemap import get_sitemap_parser
+        parser = get_sitemap_parser()
         try:
-            urls = parser.parse_sitemap(url)
+            # Parsing (and any nested sitemap fetches it triggers) is
+            # blocking, so it runs off the event loop.
+            urls = await run_in_threadpool(
+                parser.parse_sitemap_content, response.content, source_url=url,
+            )
             return ValidateSitemapResponse(
                 valid=True,
                 page_count=len(urls),
+                error=None,
             )
         except Exception as e:
             return ValidateSitemapResponse(
                 valid=False,
+                page_count=None,
                 error=f"Failed to parse sitemap: {str(e)}",
             )
-        finally:
-            parser.close()
-    
-    except requests.RequestException as e:
+
+    except httpx.HTTPError as e:
         return ValidateSitemapResponse(
             valid=False,
+            page_count=None,
             error=str(e),
         )
@@ -1,5 +1,6 @@
 """Reports API endpoints."""
 
+import asyncio
 import os
 from typing import Optional
 
@@ -7,12 +8,26 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from ..models import Crawl, CrawlStatus, get_db
 from ..storage import get_storage
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
+# One lock per crawl so concurrent downloads of a missing HTML report
+# regenerate it once instead of racing the same CSV parse.
+_regen_locks: dict[str, asyncio.Lock] = {}
+
+
+def _regenerate_html(local_csv: str, local_html: str) -> None:
+    """Rebuild the HTML report from its CSV (blocking, CPU-heavy)."""
+    from link_checker.html_reporter import HTMLReportGenerator
+
+    reporter = HTMLReportGenerator()
+    reporter.load_csv(local_csv)
+    reporter.generate_html(local_html)
+
 
 @router.get("/{crawl_id}/download/csv")
 async def download_csv(
@@ -54,20 +69,30 @@ async def download_html(
     storage = get_storage()
     if not crawl.report_html_path or not storage.exists(crawl.report_html_path):
         if crawl.report_csv_path and storage.exists(crawl.report_csv_path):
-            from link_checker.html_reporter import HTMLReportGenerator
             import tempfile
 
-            local_csv = storage.localize(crawl.report_csv_path)
-            fd, local_html = tempfile.mkstemp(suffix=".html")
-            os.close(fd)
-            reporter = HTMLReportGenerator()
-            reporter.load_csv(local_csv)
-            reporter.generate_html(local_html)
+            lock = _regen_locks.setdefault(crawl_id, asyncio.Lock())
+            async with lock:
+                # Another request may have finished the regeneration while
+                # this one waited on the lock.
+                await db.refresh(crawl)
+                if not crawl.report_html_path or not storage.exists(
+                    crawl.report_html_path
+                ):
+                    local_csv = storage.localize(crawl.report_csv_path)
+                    fd, local_html = tempfile.mkstemp(suffix=".html")
+                    os.close(fd)
+                    # The CSV parse and HTML render are seconds of CPU on
+                    # big reports; keep them off the event loop.
+                    await run_in_threadpool(
+                        _regenerate_html, local_csv, local_html,
+                    )
 
-            html_key = f"{crawl_id}/report.html"
-            storage.put_file(html_key, local_html)
-            crawl.report_html_path = html_key
-            await db.commit()
+                    html_key = f"{crawl_id}/report.html"
+                    storage.put_file(html_key, local_html)
+                    crawl.report_html_path = html_key
+                    await db.commit()
+            _regen_locks.pop(crawl_id, None)
         else:
             raise HTTPException(status_code=404, detail="Report not available")
     
@@ -12,18 +12,32 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 SETTINGS_FILE = settings.data_dir / "settings.json"
 
+# (mtime, parsed settings) of the last read; settings change rarely but
+# are read on every dashboard load, so skip the stat+read+parse unless
+# the file actually changed.
+_settings_cache: tuple[float, dict] | None = None
+
 
 def load_user_settings() -> dict:
     """Load user settings from file."""
-    if SETTINGS_FILE.exists():
-        return json.loads(SETTINGS_FILE.read_text())
-    return {}
+    global _settings_cache
+    try:
+        mtime = SETTINGS_FILE.stat().st_mtime
+    except OSError:
+        return {}
+    if _settings_cache is not None and _settings_cache[0] == mtime:
+        return _settings_cache[1]
+    data = json.loads(SETTINGS_FILE.read_text())
+    _settings_cache = (mtime, data)
+    return data
 
 
 def save_user_settings(data: dict) -> None:
     """Save user settings to file."""
+    global _settings_cache
     settings.ensure_dirs()
     SETTINGS_FILE.write_text(json.dumps(data, indent=2))
+    _settings_cache = None
 
 
 @router.get("", response_model=SettingsSchema)
@@ -3,37 +3,55 @@
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Crawl, CrawlStatus, get_db
-from ..models.schemas import StatsResponse
 
 router = APIRouter(prefix="/api/stats", tags=["stats"])
 
 
-@router.get("", response_model=StatsResponse)
+# No response_model: this endpoint is polled by the dashboard, and the
+# dict below already has the response shape — a pydantic round-trip per
+# request would only re-validate data we just computed. The app default
+# ORJSONResponse serializes it directly.
+@router.get("")
 async def get_stats(db: AsyncSession = Depends(get_db)):
     """Get dashboard statistics."""
-    result = await db.execute(select(Crawl))
-    crawls = result.scalars().all()
-    
-    total_crawls = len(crawls)
-    total_issues = sum(c.total_issues for c in crawls)
-    
     week_ago = datetime.utcnow() - timedelta(days=7)
-    crawls_this_week = sum(1 for c in crawls if c.created_at >= week_ago)
-    
-    issues_by_type = {
-        "critical": sum(c.issues_critical for c in crawls),
-        "high": sum(c.issues_high for c in crawls),
-        "medium": sum(c.issues_medium for c in crawls),
-        "low": sum(c.issues_low for c in crawls),
-    }
-    
-    return StatsResponse(
-        total_crawls=total_crawls,
-        total_issues=total_issues,
-        crawls_this_week=crawls_this_week,
-        issues_by_type=issues_by_type,
+
+    # One aggregate query instead of hydrating every Crawl row into ORM
+    # objects and summing in Python; the dashboard stays constant-time
+    # no matter how much history accumulates.
+    stmt = select(
+        func.count(Crawl.id),
+        func.coalesce(func.sum(Crawl.total_issues_col), 0),
+        func.coalesce(func.sum(Crawl.issues_critical), 0),
+        func.coalesce(func.sum(Crawl.issues_high), 0),
+        func.coalesce(func.sum(Crawl.issues_medium), 0),
+        func.coalesce(func.sum(Crawl.issues_low), 0),
+        func.coalesce(
+            func.sum(case((Crawl.created_at >= week_ago, 1), else_=0)), 0
+        ),
     )
+    (
+        total_crawls,
+        total_issues,
+        critical,
+        high,
+        medium,
+        low,
+        crawls_this_week,
+    ) = (await db.execute(stmt)).one()
+
+    return {
+        "total_crawls": total_crawls,
+        "total_issues": total_issues,
+        "crawls_this_week": crawls_this_week,
+        "issues_by_type": {
+            "critical": critical,
+            "high": high,
+            "medium": medium,
+            "low": low,
+        },
+    }
@@ -1,53 +1,127 @@
 """WebSocket endpoint for real-time progress updates."""
 
 import asyncio
-import json
 from datetime import datetime
-from typing import Dict, Set
+from typing import Dict, Optional
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from sqlalchemy import select
 
+from ..config import settings
 from ..models import Crawl, CrawlStatus
 from ..models.database import async_session
 
 router = APIRouter()
 
-active_connections: Dict[str, Set[WebSocket]] = {}
+# Seconds between keepalive pings when no progress is flowing.
+HEARTBEAT_INTERVAL = 30.0
+
+# Seconds between database polls when the crawl runs in another process
+# (Celery) and worker pushes cannot reach this loop.
+POLL_INTERVAL = 1.5
+
+TERMINAL_STATUSES = (
+    CrawlStatus.COMPLETED,
+    CrawlStatus.FAILED,
+    CrawlStatus.CANCELLED,
+)
+
+
+async def _send(websocket: WebSocket, message: dict):
+    """Serialize with orjson and send as a binary frame.
+
+    orjson is several times faster than the stdlib json that send_json
+    uses, which matters when broadcasting many small progress messages.
+    """
+    await websocket.send_bytes(orjson.dumps(message))
+
+
+def progress_message(crawl: Crawl) -> dict:
+    """Build the progress payload for a crawl row."""
+    elapsed = 0.0
+    if crawl.started_at:
+        if crawl.completed_at:
+            elapsed = (crawl.completed_at - crawl.started_at).total_seconds()
+        else:
+            elapsed = (datetime.utcnow() - crawl.started_at).total_seconds()
+
+    return {
+        "type": "progress",
+        "crawl_id": crawl.id,
+        "status": crawl.status_value,
+        "pages_crawled": crawl.pages_crawled,
+        "total_pages": crawl.total_pages,
+        "links_checked": crawl.links_checked,
+        "issues_found": crawl.total_issues,
+        "issues": {
+            "critical": crawl.issues_critical,
+            "high": crawl.issues_high,
+            "medium": crawl.issues_medium,
+            "low": crawl.issues_low,
+        },
+        "elapsed_seconds": elapsed,
+        "error_message": crawl.error_message,
+    }
+
+
+def complete_message(crawl: Crawl) -> dict:
+    """Build the completion payload for a crawl row."""
+    return {
+        "type": "complete",
+        "crawl_id": crawl.id,
+        "status": crawl.status_value,
+        "report_available": bool(crawl.report_csv_path),
+    }
 
 
 class ConnectionManager:
     """Manage WebSocket connections."""
-    
+
     def __init__(self):
-        self.connections: Dict[str, Set[WebSocket]] = {}
-    
+        # Keyed by id(websocket): insertion-ordered for fair broadcast,
+        # and removal is a dict pop instead of rehashing the socket.
+        self.connections: Dict[str, Dict[int, WebSocket]] = {}
+        # Event loop serving the sockets, captured on connect so worker
+        # threads can schedule broadcasts onto it.
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
     async def connect(self, crawl_id: str, websocket: WebSocket):
         """Accept and register a new connection."""
         await websocket.accept()
-        if crawl_id not in self.connections:
-            self.connections[crawl_id] = set()
-        self.connections[crawl_id].add(websocket)
-    
+        self.loop = asyncio.get_running_loop()
+        self.connections.setdefault(crawl_id, {})[id(websocket)] = websocket
+
     def disconnect(self, crawl_id: str, websocket: WebSocket):
         """Remove a connection."""
         if crawl_id in self.connections:
-            self.connections[crawl_id].discard(websocket)
+            self.connections[crawl_id].pop(id(websocket), None)
             if not self.connections[crawl_id]:
                 del self.connections[crawl_id]
-    
+
     async def broadcast(self, crawl_id: str, message: dict):
-        """Send message to all connections for a crawl."""
-        if crawl_id in self.connections:
-            dead_connections = set()
-            for connection in self.connections[crawl_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    dead_connections.add(connection)
-            
-            for dead in dead_connections:
-                self.connections[crawl_id].discard(dead)
+        """
+        Send message to all connections for a crawl.
+
+        Sends run concurrently so one slow or backpressured client can't
+        delay the rest; latency is bounded by the slowest socket rather
+        than the sum. The snapshot list keeps concurrent connects and
+        disconnects during the await safe.
+        """
+        registry = self.connections.get(crawl_id)
+        if not registry:
+            return
+        connections = list(registry.values())
+
+        payload = orjson.dumps(message)
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True,
+        )
+
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.connections.get(crawl_id, {}).pop(id(connection), None)
 
 
 manager = ConnectionManager()
@@ -55,61 +129,66 @@ manager = ConnectionManager()
 
 @router.websocket("/ws/crawl/{crawl_id}")
 async def crawl_progress_websocket(websocket: WebSocket, crawl_id: str):
-    """WebSocket endpoint for crawl progress updates."""
+    """
+    WebSocket endpoint for crawl progress updates.
+
+    Sends one snapshot from the database on connect. When the worker
+    runs in-process (a thread), updates are pushed through the
+    connection manager and idle connections cost no queries; the
+    receive loop only detects client disconnects and emits a keepalive
+    ping between updates. Under Celery the worker lives in another
+    process and its pushes never reach this loop, so the endpoint falls
+    back to polling the crawl row instead.
+    """
     await manager.connect(crawl_id, websocket)
-    
+
     try:
-        while True:
-            async with async_session() as db:
-                result = await db.execute(select(Crawl).where(Crawl.id == crawl_id))
-                crawl = result.scalar_one_or_none()
-                
-                if not crawl:
-                    await websocket.send_json({
-                        "type": "error",
-                        "message": "Crawl not found",
-                    })
-                    break
-                
-                elapsed = 0.0
-                if crawl.started_at:
-                    if crawl.completed_at:
-                        elapsed = (crawl.completed_at - crawl.started_at).total_seconds()
-                    else:
-                        elapsed = (datetime.utcnow() - crawl.started_at).total_seconds()
-                
-                await websocket.send_json({
-                    "type": "progress",
-                    "crawl_id": crawl_id,
-                    "status": crawl.status.value,
-                    "pages_crawled": crawl.pages_crawled,
-                    "total_pages": crawl.total_pages,
-                    "links_checked": crawl.links_checked,
-                    "issues_found": crawl.total_issues,
-                    "issues": {
-                        "critical": crawl.issues_critical,
-                        "high": crawl.issues_high,
-                        "medium": crawl.issues_medium,
-                        "low": crawl.issues_low,
-                    },
-                    "elapsed_seconds": elapsed,
-                    "error_message": crawl.error_message,
+        async with async_session() as db:
+            result = await db.execute(select(Crawl).where(Crawl.id == crawl_id))
+            crawl = result.scalar_one_or_none()
+
+            if not crawl:
+                await _send(websocket, {
+                    "type": "error",
+                    "message": "Crawl not found",
                 })
-                
-                if crawl.status in (CrawlStatus.COMPLETED, CrawlStatus.FAILED, CrawlStatus.CANCELLED):
-                    await websocket.send_json({
-                        "type": "complete",
-                        "crawl_id": crawl_id,
-                        "status": crawl.status.value,
-                        "report_available": bool(crawl.report_csv_path),
-                    })
-                    break
-            
+                return
+
+            await _send(websocket, progress_message(crawl))
+
+            if crawl.status in TERMINAL_STATUSES:
+                await _send(websocket, complete_message(crawl))
+                return
+
+        poll = settings.use_celery
+
+        while True:
             try:
-                await asyncio.wait_for(websocket.receive_text(), timeout=1.5)
+                await asyncio.wait_for(
+                    websocket.receive_text(),
+                    timeout=POLL_INTERVAL if poll else HEARTBEAT_INTERVAL,
+                )
             except asyncio.TimeoutError:
-                pass
-    
+                if not poll:
+                    # No client traffic; ping so dead sockets surface.
+                    await _send(websocket, {"type": "ping"})
+                    continue
+
+                async with async_session() as db:
+                    result = await db.execute(
+                        select(Crawl).where(Crawl.id == crawl_id)
+                    )
+                    crawl = result.scalar_one_or_none()
+
+                if crawl is None:
+                    return
+
+                await _send(websocket, progress_message(crawl))
+
+                if crawl.status in TERMINAL_STATUSES:
+                    await _send(websocket, complete_message(crawl))
+                    return
+
     except WebSocketDisconnect:
         pass
     finally:
@@ -123,3 +202,28 @@ async def send_progress_update(crawl_id: str, data: dict):
         "crawl_id": crawl_id,
         **data,
     })
+
+
+def notify_from_worker(crawl_id: str, message: dict):
+    """
+    Thread-safe broadcast entry point for the in-process crawl worker.
+
+    The worker thread has no event loop; this schedules the broadcast
+    onto the loop serving the sockets. It only works when the worker
+    shares the server process — under Celery the worker's copy of the
+    manager has no loop and the endpoint polls the database instead.
+    No-ops when nobody is watching the crawl.
+    """
+    loop = manager.loop
+    if loop is None or loop.is_closed():
+        return
+    if not manager.connections.get(crawl_id):
+        return
+
+    try:
+        asyncio.run_coroutine_threadsafe(
+            manager.broadcast(crawl_id, message), loop,
+        )
+    except RuntimeError:
+        # Loop shut down between the check and the call; drop the update.
+        pass
@@ -0,0 +1,191 @@
+"""Command-line entry point.
+
+Kept separate from main so that --help and --version don't pay the
+FastAPI/SQLAlchemy import cost: uvicorn loads linkcanary_ui.main:app in
+the server process only after arguments are parsed.
+"""
+
+import argparse
+from pathlib import Path
+
+from . import __version__
+from .config import settings
+
+
+def cli():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        prog="linkcanary-ui",
+        description="Start the LinkCanary web interface",
+    )
+
+    parser.add_argument(
+        "--host",
+        default=settings.host,
+        help=f"Host to bind to (default: {settings.host})",
+    )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=settings.port,
+        help=f"Port to bind to (default: {settings.port})",
+    )
+
+    parser.add_argument(
+        "--open",
+        action="store_true",
+        help="Open browser automatically",
+    )
+
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=None,
+        help=f"Data directory (default: {settings.data_dir})",
+    )
+
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug mode",
+    )
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"linkcanary-ui {__version__}",
+    )
+
+    # White Label Report Options
+    report_group = parser.add_argument_group('White Label Report Options')
+    report_group.add_argument(
+        '--white-label-logo',
+        help='Path to client logo image (PNG/SVG)',
+        default=None
+    )
+    report_group.add_argument(
+        '--white-label-color',
+        default='#2563eb',
+        help='Primary brand color (hex code)'
+    )
+    report_group.add_argument(
+        '--white-label-title',
+        default='Link Audit Report',
+        help='Custom report title'
+    )
+    report_group.add_argument(
+        '--white-label-client',
+        help='Client name for report header',
+        default=None
+    )
+    report_group.add_argument(
+        '--output-format',
+        choices=['html', 'pdf'],
+        default='html',
+        help='Report format (html or pdf)'
+    )
+    report_group.add_argument(
+        '--generate-report',
+        action='store_true',
+        help='Generate a white-label report'
+    )
+
+    args = parser.parse_args()
+
+    if args.data_dir:
+        settings.data_dir = args.data_dir
+
+    if args.debug:
+        settings.debug = True
+
+    settings.ensure_dirs()
+
+    print(f"""
+LinkCanary UI v{__version__}
+{'=' * 40}
+Server: http://{args.host}:{args.port}
+Data:   {settings.data_dir}
+{'=' * 40}
+""")
+
+    if args.generate_report:
+        from datetime import datetime
+        from linkcanary_ui.report_generator import create_white_label_report
+
+        # Mock data for demonstration - in real implementation, this would come from crawl results
+        report_data = {
+            'site_url': 'https://example.com',
+            'crawl_date': datetime.now(),
+            'total_links': 150,
+            'broken_links': 12,
+            'redirect_links': 8,
+            'ok_links': 130,
+            'issues_by_type': {
+                '404 Not Found': 12,
+                '500 Server Error': 3,
+                'Redirect Chain': 5,
+                'Slow Response': 7
+            },
+            'detailed_issues': [
+                {
+                    'url': 'https://example.com/broken-page',
+                    'status': '404',
+                    'issue_type': 'Broken Link',
+                    'priority': 'high',
+                    'details': 'Page not found'
+                },
+                {
+                    'url': 'https://example.com/redirect-chain',
+                    'status': '301',
+                    'issue_type': 'Redirect Chain',
+                    'priority': 'medium',
+                    'details': 'Multiple redirects detected'
+                }
+            ]
+        }
+
+        output_path = f"linkcanary_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if args.output_format == 'pdf':
+            output_path += '.pdf'
+        else:
+            output_path += '.html'
+
+        result = create_white_label_report(
+            site_url=report_data['site_url'],
+            crawl_date=report_data['crawl_date'],
+            total_links=report_data['total_links'],
+            broken_links=report_data['broken_links'],
+            redirect_links=report_data['redirect_links'],
+            ok_links=report_data['ok_links'],
+            issues_by_type=report_data['issues_by_type'],
+            detailed_issues=report_data['detailed_issues'],
+            logo_path=args.white_label_logo,
+            brand_color=args.white_label_color,
+            report_title=args.white_label_title,
+            client_name=args.white_label_client,
+            output_format=args.output_format,
+            output_path=output_path
+        )
+
+        print(f"✅ Report generated successfully: {result}")
+        return
+
+    # Deferred: pulls in the full FastAPI/SQLAlchemy app tree.
+    import webbrowser
+
+    import uvicorn
+
+    if args.open:
+        webbrowser.open(f"http://{args.host}:{args.port}")
+
+    uvicorn.run(
+        "linkcanary_ui.main:app",
+        host=args.host,
+        port=args.port,
+        reload=args.debug,
+    )
+
+
+if __name__ == "__main__":
+    cli()
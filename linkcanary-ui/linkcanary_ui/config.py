@@ -1,6 +1,7 @@
 """Application configuration."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -75,4 +76,10 @@ class Settings(BaseSettings):
         self.crawls_dir.mkdir(parents=True, exist_ok=True)
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings singleton (env parsing happens once)."""
+    return Settings()
+
+
+settings = get_settings()
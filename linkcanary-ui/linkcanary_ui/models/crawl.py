@@ -5,7 +5,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, Enum, Float, Integer, String, Text
+from sqlalchemy import JSON, CheckConstraint, Computed, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
@@ -24,6 +24,16 @@ class Crawl(Base):
     """Crawl database model."""
     
     __tablename__ = "crawls"
+    # Listing sorts by created_at and filters by status; without these
+    # the list endpoint scans the whole table on every page load.
+    __table_args__ = (
+        Index("ix_crawls_created_at", "created_at"),
+        Index("ix_crawls_status_created_at", "status", "created_at"),
+        CheckConstraint(
+            "status IN ('pending', 'in_progress', 'completed', 'failed', 'cancelled')",
+            name="ck_crawls_status",
+        ),
+    )
     
     id: Mapped[str] = mapped_column(
         String(36),
@@ -32,9 +42,13 @@ class Crawl(Base):
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     sitemap_url: Mapped[str] = mapped_column(Text, nullable=False)
-    status: Mapped[CrawlStatus] = mapped_column(
-        Enum(CrawlStatus),
-        default=CrawlStatus.PENDING,
+    # Stored as a plain VARCHAR (guarded by the CHECK constraint above):
+    # CrawlStatus is a str-enum, so comparisons against its members still
+    # work, but loads skip the per-row Enum instantiation that hot paths
+    # like cancellation polling paid with the Enum column type.
+    status: Mapped[str] = mapped_column(
+        String(16),
+        default=CrawlStatus.PENDING.value,
         nullable=False,
     )
     
@@ -65,6 +79,17 @@ class Crawl(Base):
     issues_high: Mapped[int] = mapped_column(Integer, default=0)
     issues_medium: Mapped[int] = mapped_column(Integer, default=0)
     issues_low: Mapped[int] = mapped_column(Integer, default=0)
+    # Stored generated column: the database keeps the total in sync, so
+    # aggregates sum one column instead of four and never re-do the
+    # arithmetic per row in Python.
+    total_issues_col: Mapped[int] = mapped_column(
+        "total_issues",
+        Integer,
+        Computed(
+            "issues_critical + issues_high + issues_medium + issues_low",
+            persisted=True,
+        ),
+    )
     
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
@@ -81,6 +106,12 @@ class Crawl(Base):
             return (self.completed_at - self.started_at).total_seconds()
         return None
     
+    @property
+    def status_value(self) -> str:
+        """Status as its plain string, whether set as str or CrawlStatus."""
+        status = self.status
+        return status.value if isinstance(status, CrawlStatus) else status
+
     @property
     def total_issues(self) -> int:
         """Get total issue count."""
@@ -97,7 +128,7 @@ class Crawl(Base):
             "id": self.id,
             "name": self.name,
             "sitemap_url": self.sitemap_url,
-            "status": self.status.value,
+            "status": self.status_value,
             "settings": {
                 "internal_only": self.internal_only,
                 "external_only": self.external_only,
@@ -110,9 +141,11 @@ class Crawl(Base):
                 "since": self.since_date,
                 "user_agent": self.user_agent,
             },
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            # Raw datetimes: orjson (and pydantic) serialize them in C,
+            # which beats calling .isoformat() per field in Python.
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
             "duration_seconds": self.duration_seconds,
             "pages_crawled": self.pages_crawled,
             "total_pages": self.total_pages,
@@ -1,6 +1,6 @@
 """Database setup and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
@@ -12,10 +12,32 @@ class Base(DeclarativeBase):
     pass
 
 
+def tune_sqlite(sync_engine) -> None:
+    """Apply SQLite pragmas for concurrent access on every connection.
+
+    WAL lets the API's readers proceed while the crawl worker commits,
+    and synchronous=NORMAL (safe under WAL) halves the fsync cost per
+    commit. No-op for non-SQLite databases (e.g. the Postgres prod
+    stack).
+    """
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
 engine = create_async_engine(
     settings.db_url,
     echo=settings.debug,
 )
+tune_sqlite(engine.sync_engine)
 
 async_session = sessionmaker(
     engine,
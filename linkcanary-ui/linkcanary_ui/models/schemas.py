@@ -1,9 +1,24 @@
 """Pydantic schemas for API requests/responses."""
 
 from datetime import datetime
-from typing import Optional
-
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = [
+    "CrawlSettings", "CrawlCreate", "CrawlIssues", "CrawlResponse",
+    "CrawlListResponse", "CrawlProgress",
+    "ValidateSitemapRequest", "ValidateSitemapResponse",
+    "StatsResponse", "ReportIssue", "ReportResponse", "SettingsSchema",
+    "BacklinkCheckRequest", "BacklinkSource", "BacklinkCheckResponse",
+    "WebhookTypeLit", "WebhookEventLit",
+    "WebhookCreate", "WebhookUpdate", "WebhookSummaryResponse",
+    "WebhookResponse", "WebhookListResponse", "WebhookTestRequest",
+    "WebhookPayload",
+    "UrlResolutionRequest", "ResolvedUrl", "UrlResolutionResult",
+    "UrlResolutionResponse",
+    "CrawlTransparencyResponse", "ShareResponse",
+]
 
 
 class CrawlSettings(BaseModel):
@@ -56,14 +71,14 @@ class CrawlResponse(BaseModel):
     report_html_path: Optional[str]
     share_token: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 
 class CrawlListResponse(BaseModel):
     """List of crawls response."""
     crawls: list[CrawlResponse]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[datetime] = None
 
 
 class CrawlProgress(BaseModel):
@@ -160,14 +175,21 @@ class BacklinkCheckResponse(BaseModel):
     total_pages: int
 
 
+# Kept in sync with WebhookType/WebhookEvent in models.webhook. Literal
+# membership is checked inside pydantic-core's compiled path, so invalid
+# values are rejected at request parsing instead of in handler code.
+WebhookTypeLit = Literal["slack", "discord", "generic", "jira", "asana"]
+WebhookEventLit = Literal["crawl_completed", "crawl_failed", "issues_found"]
+
+
 class WebhookCreate(BaseModel):
     """Request to create a webhook."""
     name: str
-    type: str = Field(description="Webhook type: slack, discord, generic, jira, or asana")
+    type: WebhookTypeLit = Field(description="Webhook type: slack, discord, generic, jira, or asana")
     url: str = Field(default="", description="Webhook URL (not needed for jira/asana)")
     secret: Optional[str] = None
     enabled: bool = True
-    trigger_events: list[str] = Field(
+    trigger_events: list[WebhookEventLit] = Field(
         default=["crawl_completed"],
         description="Events: crawl_completed, crawl_failed, issues_found"
     )
@@ -193,7 +215,7 @@ class WebhookUpdate(BaseModel):
     url: Optional[str] = None
     secret: Optional[str] = None
     enabled: Optional[bool] = None
-    trigger_events: Optional[list[str]] = None
+    trigger_events: Optional[list[WebhookEventLit]] = None
     filters: Optional[dict] = None
     # Jira configuration
     jira_url: Optional[str] = None
@@ -207,6 +229,24 @@ class WebhookUpdate(BaseModel):
     asana_project_id: Optional[str] = None
 
 
+class WebhookSummaryResponse(BaseModel):
+    """Webhook summary row as returned by the list endpoint.
+
+    Omits the secret and the Jira/Asana configuration; the detail
+    endpoint returns the full WebhookResponse.
+    """
+    id: str
+    name: str
+    type: str
+    url: str
+    enabled: bool
+    trigger_events: list[str]
+    created_at: Optional[datetime]
+    last_triggered_at: Optional[datetime]
+    last_trigger_status: Optional[str]
+    trigger_count: int
+
+
 class WebhookResponse(BaseModel):
     """Webhook response schema."""
     id: str
@@ -233,8 +273,7 @@ class WebhookResponse(BaseModel):
     last_trigger_status: Optional[str]
     trigger_count: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 
 class WebhookListResponse(BaseModel):
@@ -5,7 +5,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, JSON, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Index, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
@@ -32,6 +32,13 @@ class Webhook(Base):
 
     __tablename__ = "webhooks"
 
+    # list_webhooks filters on enabled/type and sorts by created_at;
+    # these composite indexes serve both the filter and the sort.
+    __table_args__ = (
+        Index("ix_webhooks_enabled_created", "enabled", "created_at"),
+        Index("ix_webhooks_type_created", "type", "created_at"),
+    )
+
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
@@ -47,10 +54,13 @@ class Webhook(Base):
     secret: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    trigger_events: Mapped[Optional[str]] = mapped_column(
-        Text,
+    # Stored as JSON so the value stays a Python list end-to-end — no
+    # CSV split on every access, and databases with JSON operators can
+    # filter webhooks by event directly.
+    trigger_events: Mapped[Optional[list]] = mapped_column(
+        JSON,
         nullable=True,
-        default="crawl_completed,crawl_failed",
+        default=lambda: ["crawl_completed", "crawl_failed"],
     )
     filters: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
@@ -81,18 +91,11 @@ class Webhook(Base):
     )
     trigger_count: Mapped[int] = mapped_column(default=0)
 
-    @property
-    def events_list(self) -> list[str]:
-        """Get trigger events as a list."""
-        if not self.trigger_events:
-            return []
-        return [e.strip() for e in self.trigger_events.split(",") if e.strip()]
-
     def should_trigger(self, event: str, issue_count: int = 0) -> bool:
         """Check if webhook should trigger for given event."""
         if not self.enabled:
             return False
-        if event not in self.events_list:
+        if event not in (self.trigger_events or []):
             return False
         if self.filters and "min_issues" in self.filters:
             if issue_count < self.filters["min_issues"]:
@@ -101,25 +104,35 @@ class Webhook(Base):
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        # Read the loaded column values straight out of __dict__ instead
+        # of going through twenty instrumented-attribute descriptors.
+        # Safe here: the session keeps attributes loaded across commit
+        # (expire_on_commit=False) and to_dict is only called on
+        # persisted instances.
+        d = self.__dict__
         return {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type.value,
-            "url": self.url,
-            "secret": "***" if self.secret else None,
-            "enabled": self.enabled,
-            "trigger_events": self.events_list,
-            "filters": self.filters,
-            "jira_url": self.jira_url,
-            "jira_email": self.jira_email,
-            "jira_api_token": "***" if self.jira_api_token else None,
-            "jira_project_key": self.jira_project_key,
-            "jira_issue_type": self.jira_issue_type,
-            "asana_token": "***" if self.asana_token else None,
-            "asana_workspace_id": self.asana_workspace_id,
-            "asana_project_id": self.asana_project_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "last_triggered_at": self.last_triggered_at.isoformat() if self.last_triggered_at else None,
-            "last_trigger_status": self.last_trigger_status,
-            "trigger_count": self.trigger_count,
+            "id": d["id"],
+            "name": d["name"],
+            "type": d["type"].value,
+            "url": d["url"],
+            "secret": "***" if d["secret"] else None,
+            "enabled": d["enabled"],
+            "trigger_events": d["trigger_events"] or [],
+            "filters": d["filters"],
+            "jira_url": d["jira_url"],
+            "jira_email": d["jira_email"],
+            "jira_api_token": "***" if d["jira_api_token"] else None,
+            "jira_project_key": d["jira_project_key"],
+            "jira_issue_type": d["jira_issue_type"],
+            "asana_token": "***" if d["asana_token"] else None,
+            "asana_workspace_id": d["asana_workspace_id"],
+            "asana_project_id": d["asana_project_id"],
+            # Raw datetimes: both orjson and pydantic-core serialize
+            # them in C, so no Python-level .isoformat() per field.
+            "created_at": d["created_at"],
+            # .get: these have no default, so a freshly inserted row has
+            # no entry for them in __dict__ until they are first set.
+            "last_triggered_at": d.get("last_triggered_at"),
+            "last_trigger_status": d.get("last_trigger_status"),
+            "trigger_count": d["trigger_count"],
         }
@@ -1,23 +1,73 @@
 """Webhook notification service."""
 
+import base64
 import hashlib
 import hmac
-import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+import httpx
+import orjson
 import requests
-from sqlalchemy import select
+from sqlalchemy import String, cast, select
 
 from ..models import Webhook, WebhookEvent, WebhookType
 from ..config import settings
 
+# Payload datetimes are emitted by orjson in Rust as RFC3339 with a Z
+# suffix; naive values (none expected) are treated as UTC.
+_ORJSON_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
 
 class WebhookService:
     """Service for sending webhook notifications."""
 
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Keep-alive pooling for the sync path: webhook targets are a
+        # small set of hosts hit repeatedly, so reusing connections
+        # saves the TCP+TLS handshake on every delivery after the first.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=64
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Fire-and-forget trigger queue; the worker thread starts on
+        # first use so merely importing the service never spawns one.
+        self._trigger_queue: queue.Queue = queue.Queue()
+        self._trigger_worker: Optional[threading.Thread] = None
+        # Body formatter per type; absent types (generic) send the
+        # payload as-is. Jira/Asana never reach this table — they have
+        # dedicated endpoints and auth in _build_request.
+        self._formatters = {
+            WebhookType.SLACK: self.format_slack_payload,
+            WebhookType.DISCORD: self.format_discord_payload,
+        }
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Shared async client, kept alive so repeat sends to the same
+        endpoints reuse connections."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                ),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients (app shutdown hook)."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self._session.close()
 
     def build_payload(
         self,
@@ -28,8 +78,16 @@ class WebhookService:
         summary: dict,
         crawl_name: Optional[str] = None,
         report_url: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
     ) -> dict:
-        """Build the webhook payload."""
+        """Build the webhook payload.
+
+        Callers that already read the clock (trigger_webhooks stamps the
+        batch's audit fields with the same instant) pass it in rather
+        than paying a second read.
+        """
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
         return {
             "event": event,
             "crawl_id": crawl_id,
@@ -38,16 +96,33 @@ class WebhookService:
             "status": status,
             "summary": summary,
             "report_url": report_url,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # Left as a datetime: orjson renders it during body
+            # serialization, skipping Python-side isoformat work.
+            "timestamp": timestamp,
         }
 
+    @staticmethod
+    def _derive(payload: dict) -> tuple[str, str, int, dict]:
+        """Display values every formatter needs, computed in one place.
+
+        Returns (event_title, status_title, total_issues, issues).
+        """
+        event = payload.get("event", "").replace("_", " ").title()
+        status_title = payload.get("status", "").title()
+        summary = payload.get("summary", {})
+        issues = summary.get("issues", {})
+        # trigger_webhooks already summed the issues for its filter
+        # check and stashes the scalar; only ad-hoc payloads pay the sum.
+        total_issues = summary.get("total_issues")
+        if total_issues is None:
+            total_issues = sum(issues.values())
+        return event, status_title, total_issues, issues
+
     def format_slack_payload(self, payload: dict, webhook: Webhook) -> dict:
         """Format payload for Slack incoming webhook."""
-        event = payload.get("event", "").replace("_", " ").title()
+        event, status_title, total_issues, issues = self._derive(payload)
         status = payload.get("status", "")
         summary = payload.get("summary", {})
-        issues = summary.get("issues", {})
-        total_issues = sum(issues.values())
 
         color = "#36a64f" if status == "completed" else "#dc3545"
 
@@ -63,7 +138,7 @@ class WebhookService:
                 "type": "section",
                 "fields": [
                     {"type": "mrkdwn", "text": f"*Crawl:*\n{payload.get('crawl_name', 'Unnamed')}"},
-                    {"type": "mrkdwn", "text": f"*Status:*\n{status.title()}"},
+                    {"type": "mrkdwn", "text": f"*Status:*\n{status_title}"},
                     {"type": "mrkdwn", "text": f"*Pages Crawled:*\n{summary.get('pages_crawled', 0)}"},
                     {"type": "mrkdwn", "text": f"*Links Checked:*\n{summary.get('links_checked', 0)}"},
                 ]
@@ -95,11 +170,9 @@ class WebhookService:
 
     def format_discord_payload(self, payload: dict, webhook: Webhook) -> dict:
         """Format payload for Discord webhook."""
-        event = payload.get("event", "").replace("_", " ").title()
+        event, status_title, total_issues, issues = self._derive(payload)
         status = payload.get("status", "")
         summary = payload.get("summary", {})
-        issues = summary.get("issues", {})
-        total_issues = sum(issues.values())
 
         color = 3066993 if status == "completed" else 15158332
 
@@ -110,7 +183,7 @@ class WebhookService:
             "timestamp": payload.get("timestamp"),
             "fields": [
                 {"name": "Crawl", "value": payload.get("crawl_name", "Unnamed"), "inline": True},
-                {"name": "Status", "value": status.title(), "inline": True},
+                {"name": "Status", "value": status_title, "inline": True},
                 {"name": "Pages Crawled", "value": str(summary.get("pages_crawled", 0)), "inline": True},
                 {"name": "Links Checked", "value": str(summary.get("links_checked", 0)), "inline": True},
             ],
@@ -128,18 +201,15 @@ class WebhookService:
 
     def format_jira_payload(self, payload: dict, webhook: Webhook) -> dict:
         """Format payload for Jira issue creation."""
-        event = payload.get("event", "").replace("_", " ").title()
-        status = payload.get("status", "")
+        event, status_title, total_issues, issues = self._derive(payload)
         summary = payload.get("summary", {})
-        issues = summary.get("issues", {})
-        total_issues = sum(issues.values())
 
         issue_summary = f"LinkCanary: {payload.get('crawl_name', 'Crawl')} - {event}"
         issue_description = f"""
 h2. LinkCanary Crawl Report
 
 *Event:* {event}
-*Status:* {status.title()}
+*Status:* {status_title}
 *Sitemap:* {payload.get('sitemap_url', 'N/A')}
 
 h3. Summary
@@ -169,17 +239,14 @@ h3. Summary
 
     def format_asana_payload(self, payload: dict, webhook: Webhook) -> dict:
         """Format payload for Asana task creation."""
-        event = payload.get("event", "").replace("_", " ").title()
-        status = payload.get("status", "")
+        event, status_title, total_issues, issues = self._derive(payload)
         summary = payload.get("summary", {})
-        issues = summary.get("issues", {})
-        total_issues = sum(issues.values())
 
         task_name = f"LinkCanary: {payload.get('crawl_name', 'Crawl')} - {event}"
         task_notes = f"""LinkCanary Crawl Report
 
 Event: {event}
-Status: {status.title()}
+Status: {status_title}
 Sitemap: {payload.get('sitemap_url', 'N/A')}
 
 Summary:
@@ -207,65 +274,101 @@ Summary:
 
         return task_data
 
-    def send_jira(self, webhook: Webhook, payload: dict) -> tuple[bool, Optional[str]]:
-        """Send issue to Jira. Returns (success, error_message)."""
-        if not webhook.jira_url or not webhook.jira_api_token:
-            return False, "Jira configuration incomplete (missing URL or API token)"
+    def _build_request(
+        self,
+        webhook: Webhook,
+        payload: dict,
+        webhook_type: Optional[WebhookType] = None,
+        body_cache: Optional[dict] = None,
+    ) -> tuple[str, bytes, dict]:
+        """Resolve the endpoint, serialized body, and headers for a webhook.
+
+        Shared by the sync and async send paths. The body is returned as
+        JSON bytes so the signature is computed over exactly what goes on
+        the wire — re-serializing in the HTTP client could produce
+        different bytes and a mismatched signature. Raises ValueError
+        when the webhook's configuration is incomplete.
+
+        Slack/Discord/generic bodies depend only on the payload, not the
+        webhook, so a trigger fanning out to N webhooks can pass one
+        body_cache dict and format+serialize each shape once. Jira and
+        Asana bodies embed per-webhook config and are never cached.
+        """
+        webhook_type = webhook_type or webhook.type
+
+        if webhook_type == WebhookType.JIRA:
+            if not webhook.jira_url or not webhook.jira_api_token:
+                raise ValueError("Jira configuration incomplete (missing URL or API token)")
 
-        try:
-            import base64
             credentials = f"{webhook.jira_email}:{webhook.jira_api_token}"
             encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"Basic {encoded_credentials}",
             }
-
-            jira_endpoint = f"{webhook.jira_url.rstrip('/')}/rest/api/2/issue"
-            body = self.format_jira_payload(payload, webhook)
-
-            response = requests.post(
-                jira_endpoint,
-                json=body,
-                headers=headers,
-                timeout=self.timeout,
+            endpoint = f"{webhook.jira_url.rstrip('/')}/rest/api/2/issue"
+            body = orjson.dumps(
+                self.format_jira_payload(payload, webhook), option=_ORJSON_OPTS
             )
+            return endpoint, body, headers
 
-            if response.status_code in (200, 201):
-                return True, None
-            else:
-                return False, f"HTTP {response.status_code}: {response.text[:200]}"
-
-        except requests.Timeout:
-            return False, "Request timed out"
-        except requests.RequestException as e:
-            return False, str(e)
-        except Exception as e:
-            return False, f"Unexpected error: {str(e)}"
-
-    def send_asana(self, webhook: Webhook, payload: dict) -> tuple[bool, Optional[str]]:
-        """Send task to Asana. Returns (success, error_message)."""
-        if not webhook.asana_token:
-            return False, "Asana configuration incomplete (missing token)"
+        if webhook_type == WebhookType.ASANA:
+            if not webhook.asana_token:
+                raise ValueError("Asana configuration incomplete (missing token)")
 
-        try:
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {webhook.asana_token}",
             }
+            body = orjson.dumps(
+                {"data": self.format_asana_payload(payload, webhook)},
+                option=_ORJSON_OPTS,
+            )
+            return "https://app.asana.com/api/1.0/tasks", body, headers
+
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "LinkCanary-Webhook/1.0",
+        }
+
+        if body_cache is not None and webhook_type in body_cache:
+            body_bytes = body_cache[webhook_type]
+        else:
+            formatter = self._formatters.get(webhook_type)
+            body = formatter(payload, webhook) if formatter is not None else payload
+            body_bytes = orjson.dumps(body, option=_ORJSON_OPTS)
+            if body_cache is not None:
+                body_cache[webhook_type] = body_bytes
+
+        if webhook.secret:
+            headers["X-LinkCanary-Signature"] = self._sign_bytes(body_bytes, webhook.secret)
 
-            asana_endpoint = "https://app.asana.com/api/1.0/tasks"
-            body = {"data": self.format_asana_payload(payload, webhook)}
+        return webhook.url, body_bytes, headers
 
-            response = requests.post(
-                asana_endpoint,
-                json=body,
+    def _send_sync(
+        self,
+        webhook: Webhook,
+        payload: dict,
+        webhook_type: Optional[WebhookType] = None,
+        body_cache: Optional[dict] = None,
+    ) -> tuple[bool, Optional[str]]:
+        """Send a webhook over requests. Returns (success, error_message)."""
+        try:
+            endpoint, body, headers = self._build_request(
+                webhook, payload, webhook_type, body_cache
+            )
+        except ValueError as e:
+            return False, str(e)
+
+        try:
+            response = self._session.post(
+                endpoint,
+                data=body,
                 headers=headers,
                 timeout=self.timeout,
             )
 
-            if response.status_code in (200, 201):
+            if 200 <= response.status_code < 300:
                 return True, None
             else:
                 return False, f"HTTP {response.status_code}: {response.text[:200]}"
@@ -277,62 +380,65 @@ Summary:
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
 
+    def send_jira(self, webhook: Webhook, payload: dict) -> tuple[bool, Optional[str]]:
+        """Send issue to Jira. Returns (success, error_message)."""
+        return self._send_sync(webhook, payload, WebhookType.JIRA)
+
+    def send_asana(self, webhook: Webhook, payload: dict) -> tuple[bool, Optional[str]]:
+        """Send task to Asana. Returns (success, error_message)."""
+        return self._send_sync(webhook, payload, WebhookType.ASANA)
+
+    def _sign_bytes(self, payload_bytes: bytes, secret: str) -> str:
+        """Generate an HMAC signature over serialized payload bytes."""
+        # hmac.digest is the one-shot C path (no HMAC object, straight
+        # to OpenSSL), which matters when a trigger fans out to many
+        # signed webhooks.
+        signature = hmac.digest(secret.encode(), payload_bytes, "sha256")
+        return f"sha256={signature.hex()}"
+
     def sign_payload(self, payload: dict, secret: str) -> str:
         """Generate HMAC signature for payload."""
-        payload_str = json.dumps(payload, separators=(",", ":"))
-        signature = hmac.new(
-            secret.encode(),
-            payload_str.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return f"sha256={signature}"
+        return self._sign_bytes(orjson.dumps(payload, option=_ORJSON_OPTS), secret)
 
     def send_webhook(
         self,
         webhook: Webhook,
         payload: dict,
+        body_cache: Optional[dict] = None,
     ) -> tuple[bool, Optional[str]]:
         """Send webhook notification. Returns (success, error_message)."""
-        # Handle Jira integration
-        if webhook.type == WebhookType.JIRA:
-            return self.send_jira(webhook, payload)
+        return self._send_sync(webhook, payload, body_cache=body_cache)
 
-        # Handle Asana integration
-        if webhook.type == WebhookType.ASANA:
-            return self.send_asana(webhook, payload)
+    async def send_webhook_async(
+        self,
+        webhook: Webhook,
+        payload: dict,
+    ) -> tuple[bool, Optional[str]]:
+        """Async send_webhook for fan-out from the event loop.
 
-        # Handle standard webhooks (Slack, Discord, Generic)
+        Lets callers gather many sends concurrently instead of paying
+        one blocking round trip per webhook.
+        """
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "LinkCanary-Webhook/1.0",
-            }
-
-            if webhook.type == WebhookType.SLACK:
-                body = self.format_slack_payload(payload, webhook)
-            elif webhook.type == WebhookType.DISCORD:
-                body = self.format_discord_payload(payload, webhook)
-            else:
-                body = payload
-
-            if webhook.secret:
-                headers["X-LinkCanary-Signature"] = self.sign_payload(body, webhook.secret)
+            endpoint, body, headers = self._build_request(webhook, payload)
+        except ValueError as e:
+            return False, str(e)
 
-            response = requests.post(
-                webhook.url,
-                json=body,
+        try:
+            response = await self._get_async_client().post(
+                endpoint,
+                content=body,
                 headers=headers,
-                timeout=self.timeout,
             )
 
-            if response.status_code >= 200 and response.status_code < 300:
+            if 200 <= response.status_code < 300:
                 return True, None
             else:
                 return False, f"HTTP {response.status_code}: {response.text[:200]}"
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             return False, "Request timed out"
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             return False, str(e)
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
@@ -351,11 +457,27 @@ Summary:
         """Trigger all applicable webhooks for an event."""
         results = {}
         issue_count = sum(summary.get("issues", {}).values())
+        # Precomputed for the formatters (and a convenience for generic
+        # receivers); saves re-summing the dict once per body shape.
+        summary.setdefault("total_issues", issue_count)
 
         webhooks = session.execute(
-            select(Webhook).where(Webhook.enabled == True)
+            select(Webhook).where(
+                Webhook.enabled == True,
+                # Prune non-subscribers in SQL instead of hydrating every
+                # enabled row. Event names are fixed literals with no
+                # substring overlap, so a LIKE over the serialized JSON
+                # list is a portable containment test; should_trigger
+                # below stays authoritative (it also applies min_issues).
+                cast(Webhook.trigger_events, String).like(f'%"{event}"%'),
+            )
         ).scalars().all()
 
+        # One clock read for the whole dispatch: the payload timestamp
+        # and every webhook's audit fields record the same instant.
+        now_utc = datetime.now(timezone.utc)
+        now = now_utc.replace(tzinfo=None)
+
         payload = self.build_payload(
             event=event,
             crawl_id=crawl_id,
@@ -364,21 +486,93 @@ Summary:
             summary=summary,
             crawl_name=crawl_name,
             report_url=report_url,
+            timestamp=now_utc,
         )
 
-        for webhook in webhooks:
-            if not webhook.should_trigger(event, issue_count):
-                continue
-
-            success, error = self.send_webhook(webhook, payload)
-            results[webhook.id] = (success, error)
+        to_send = [w for w in webhooks if w.should_trigger(event, issue_count)]
+        if not to_send:
+            return results
+        # Shared across the batch so each body shape (slack, discord,
+        # generic) is formatted and serialized at most once. Concurrent
+        # sends may race on a cache miss; the worst case is one extra
+        # serialization, and the winning bytes are identical.
+        body_cache: dict = {}
+
+        # Deliveries are independent network calls, each blocking up to
+        # self.timeout; fanning them out makes the trigger cost the
+        # slowest endpoint instead of the sum of all of them. DB
+        # bookkeeping stays on this thread and commits once at the end.
+        with ThreadPoolExecutor(max_workers=min(16, len(to_send))) as executor:
+            futures = {
+                executor.submit(self.send_webhook, webhook, payload, body_cache): webhook
+                for webhook in to_send
+            }
+            for future in as_completed(futures):
+                webhook = futures[future]
+                success, error = future.result()
+                results[webhook.id] = (success, error)
 
-            webhook.last_triggered_at = datetime.utcnow()
-            webhook.last_trigger_status = "success" if success else f"failed: {error}"
-            webhook.trigger_count += 1
+                webhook.last_triggered_at = now
+                webhook.last_trigger_status = "success" if success else f"failed: {error}"
+                webhook.trigger_count += 1
 
         session.commit()
         return results
 
+    def queue_trigger(
+        self,
+        event: str,
+        crawl_id: str,
+        sitemap_url: str,
+        status: str,
+        summary: dict,
+        crawl_name: Optional[str] = None,
+        report_url: Optional[str] = None,
+    ) -> None:
+        """Enqueue a trigger for background delivery and return at once.
+
+        Webhook dispatch is fire-and-forget: a slow endpoint should not
+        stall the crawl thread's completion bookkeeping for up to the
+        delivery timeout. The worker thread opens its own DB session and
+        records per-webhook status there.
+        """
+        self._trigger_queue.put({
+            "event": event,
+            "crawl_id": crawl_id,
+            "sitemap_url": sitemap_url,
+            "status": status,
+            "summary": summary,
+            "crawl_name": crawl_name,
+            "report_url": report_url,
+        })
+        if self._trigger_worker is None or not self._trigger_worker.is_alive():
+            self._trigger_worker = threading.Thread(
+                target=self._drain_trigger_queue,
+                name="webhook-delivery",
+                daemon=True,
+            )
+            self._trigger_worker.start()
+
+    def _drain_trigger_queue(self) -> None:
+        """Deliver queued triggers; runs on the daemon worker thread."""
+        # Deferred: the sync session factory lives in tasks, which
+        # imports this module at the top level.
+        from ..tasks.crawl_task import get_sync_session
+
+        while True:
+            job = self._trigger_queue.get()
+            try:
+                session = get_sync_session()
+                try:
+                    self.trigger_webhooks(session=session, **job)
+                finally:
+                    session.close()
+            except Exception:
+                # Deliveries are best-effort; a failed batch must not
+                # kill the worker thread for later triggers.
+                pass
+            finally:
+                self._trigger_queue.task_done()
+
 
 webhook_service = WebhookService(timeout=getattr(settings, 'webhook_timeout', 10))
@@ -6,34 +6,107 @@ Supports two modes:
 """
 
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import chain
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, select, update
 from sqlalchemy.orm import Session
-
-from link_checker.checker import LinkChecker
-from link_checker.crawler import PageCrawler
-from link_checker.html_reporter import HTMLReportGenerator
-from link_checker.reporter import ReportGenerator
-from link_checker.sitemap import SitemapParser
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ..config import settings
 from ..models import Crawl, CrawlStatus
+from ..models.database import tune_sqlite
 from ..services.webhooks import webhook_service
 from ..storage import get_storage
 
-sync_engine = create_engine(settings.sync_db_url)
+# Sized for several concurrent crawl workers plus the webhook delivery
+# thread; the SQLite busy timeout rides out the single-writer lock
+# instead of erroring when two workers commit at once. tune_sqlite adds
+# the WAL pragmas so cancellation reads proceed during those commits.
+_sync_connect_args = (
+    {"check_same_thread": False, "timeout": 30}
+    if settings.sync_db_url.startswith("sqlite")
+    else {}
+)
+sync_engine = create_engine(
+    settings.sync_db_url,
+    pool_size=8,
+    max_overflow=16,
+    connect_args=_sync_connect_args,
+)
+tune_sqlite(sync_engine)
 
 _running_tasks = {}
 
+# Progress is committed every PROGRESS_BATCH items or PROGRESS_INTERVAL
+# seconds, whichever comes first, instead of once per page/link: each
+# SQLite commit is an fsync, and per-item commits made disk syncs the
+# dominant cost of large crawls.
+PROGRESS_BATCH = 25
+PROGRESS_INTERVAL = 2.0
+
+# Threads used for the link-status phase. Checking is network-bound, so
+# overlapping requests across connections sets the throughput; the
+# checker's per-host delay still paces any single site.
+LINK_CHECK_WORKERS = 16
+
+# Name the Celery task explicitly so the web process can dispatch it by
+# string without importing Celery's task machinery.
+CELERY_TASK_NAME = "linkcanary_ui.tasks.run_crawl"
+
+
+def notify_progress(crawl: Crawl):
+    """Push a progress update to any WebSocket watchers."""
+    from ..api import websocket as ws
+
+    try:
+        ws.notify_from_worker(crawl.id, ws.progress_message(crawl))
+        if crawl.status in ws.TERMINAL_STATUSES:
+            ws.notify_from_worker(crawl.id, ws.complete_message(crawl))
+    except Exception:
+        # Progress updates are best-effort; never fail the crawl for them.
+        pass
+
 
 def get_sync_session():
     """Get synchronous database session."""
-    return Session(sync_engine)
+    # The worker is the only writer of its crawl's progress fields, so
+    # there is no need to re-SELECT the row after every batched commit.
+    return Session(sync_engine, expire_on_commit=False)
+
+
+def _crawl_status(session, crawl_id: str):
+    """Read just the status column, skipping ORM row hydration."""
+    return session.execute(
+        select(Crawl.status).where(Crawl.id == crawl_id)
+    ).scalar()
+
+
+def _flush_progress(session, crawl: Crawl, field: str, value: int):
+    """Write one progress counter with a Core UPDATE and commit.
+
+    Assigning crawl.<field> per iteration would keep the instance dirty
+    and make every batched commit recompute the unit-of-work; a direct
+    UPDATE skips that, and set_committed_value refreshes the in-memory
+    attribute for WebSocket progress without re-dirtying it.
+    """
+    session.execute(
+        update(Crawl).where(Crawl.id == crawl.id).values({field: value})
+    )
+    session.commit()
+    set_committed_value(crawl, field, value)
+    notify_progress(crawl)
 
 
-def trigger_webhooks(session, crawl: Crawl, event: str):
-    """Trigger webhooks for a crawl event."""
+def trigger_webhooks(crawl: Crawl, event: str):
+    """Queue webhook delivery for a crawl event.
+
+    Delivery runs on the webhook service's background worker, so a slow
+    endpoint never holds the crawl thread (and its _running_tasks slot)
+    hostage after the crawl itself is done.
+    """
     if not settings.webhook_enabled:
         return
 
@@ -52,42 +125,76 @@ def trigger_webhooks(session, crawl: Crawl, event: str):
     if crawl.report_html_path:
         report_url = f"http://{settings.host}:{settings.port}/crawls/{crawl.id}"
 
-    webhook_service.trigger_webhooks(
-        session=session,
+    webhook_service.queue_trigger(
         event=event,
         crawl_id=crawl.id,
         sitemap_url=crawl.sitemap_url,
-        status=crawl.status.value,
+        status=crawl.status_value,
         summary=summary,
         crawl_name=crawl.name,
         report_url=report_url,
     )
 
 
+def _dispatch_celery(crawl_id: str):
+    """Send the crawl to a Celery worker by task name.
+
+    Dispatching by name keeps the web process off the worker-side task
+    registration below, which is the only thing that needs Celery's full
+    task machinery.
+    """
+    from .celery_app import celery_app
+
+    if celery_app is None:
+        return None
+    return celery_app.send_task(CELERY_TASK_NAME, args=[crawl_id]).id
+
+
 def run_crawl_in_background(crawl_id: str):
     """Start crawl in background using configured backend."""
     if settings.use_celery:
-        from .celery_app import celery_app
-        if celery_app:
-            task = run_crawl_celery.delay(crawl_id)
-            return task.id
-    
+        task_id = _dispatch_celery(crawl_id)
+        if task_id is not None:
+            return task_id
+
     if crawl_id in _running_tasks:
         return None
-    
+
     thread = threading.Thread(target=_run_crawl_sync, args=(crawl_id,), daemon=True)
-    _running_tasks[crawl_id] = thread
+    _running_tasks[crawl_id] = (thread, threading.Event())
     thread.start()
     return None
 
 
 def stop_crawl_task(crawl_id: str):
-    """Mark crawl as cancelled (task will check and stop)."""
-    pass
+    """Signal an in-process crawl to stop.
+
+    Setting the event lets the hot loops notice cancellation with a
+    nanosecond flag check instead of a SELECT per iteration; the
+    periodic DB poll stays as the fallback for Celery workers, which
+    run in another process and never see this event.
+    """
+    entry = _running_tasks.get(crawl_id)
+    if entry is not None:
+        entry[1].set()
 
 
 def _run_crawl_sync(crawl_id: str):
     """Execute a crawl in the background."""
+    # Deferred: the link-checker stack pulls in pandas/lxml, which a web
+    # process that only dispatches crawls never needs at import time.
+    from link_checker.checker import LinkChecker
+    from link_checker.crawler import PageCrawler
+    from link_checker.html_reporter import HTMLReportGenerator
+    from link_checker.reporter import ReportGenerator
+    from link_checker.sitemap import get_sitemap_parser
+
+    # Threading mode stores (thread, cancel_event); under Celery there
+    # is no entry and the local event simply never fires, leaving the
+    # periodic DB poll as the only cancellation path.
+    entry = _running_tasks.get(crawl_id)
+    cancel_event = entry[1] if entry is not None else threading.Event()
+
     session = get_sync_session()
     
     try:
@@ -101,6 +208,7 @@ def _run_crawl_sync(crawl_id: str):
         crawl.status = CrawlStatus.IN_PROGRESS
         crawl.started_at = datetime.utcnow()
         session.commit()
+        notify_progress(crawl)
         
         crawl_dir = settings.crawls_dir / crawl_id
         crawl_dir.mkdir(parents=True, exist_ok=True)
@@ -108,31 +216,35 @@ def _run_crawl_sync(crawl_id: str):
         csv_path = crawl_dir / "report.csv"
         html_path = crawl_dir / "report.html"
         
-        sitemap_parser = SitemapParser(
+        # use_cache turns re-runs of an unchanged sitemap into conditional
+        # GETs (requires requests-cache; no-op without it). The parser is
+        # pooled per process, so its connections stay warm across crawls.
+        sitemap_parser = get_sitemap_parser(
             user_agent=crawl.user_agent,
             timeout=crawl.timeout,
+            use_cache=True,
         )
-        
+
         try:
             since = None
             if crawl.since_date:
                 since = datetime.strptime(crawl.since_date, '%Y-%m-%d')
-            
+
             page_urls = sitemap_parser.parse_sitemap(crawl.sitemap_url, since=since)
         except Exception as e:
             crawl.status = CrawlStatus.FAILED
             crawl.error_message = f"Failed to parse sitemap: {str(e)}"
             crawl.completed_at = datetime.utcnow()
             session.commit()
+            notify_progress(crawl)
             return {"error": crawl.error_message}
-        finally:
-            sitemap_parser.close()
         
         if not page_urls:
             crawl.status = CrawlStatus.FAILED
             crawl.error_message = "No pages found in sitemap"
             crawl.completed_at = datetime.utcnow()
             session.commit()
+            notify_progress(crawl)
             return {"error": crawl.error_message}
         
         if crawl.max_pages:
@@ -140,6 +252,7 @@ def _run_crawl_sync(crawl_id: str):
         
         crawl.total_pages = len(page_urls)
         session.commit()
+        notify_progress(crawl)
         
         crawler = PageCrawler(
             base_url=crawl.sitemap_url,
@@ -149,43 +262,58 @@ def _run_crawl_sync(crawl_id: str):
             include_subdomains=crawl.include_subdomains,
         )
         
-        all_links = []
-        
+        # Scope filtering happens as links arrive rather than in a second
+        # full pass over all_links after the crawl.
+        if crawl.internal_only:
+            keep = lambda link: link.is_internal
+        elif crawl.external_only:
+            keep = lambda link: not link.is_internal
+        else:
+            keep = None
+
+        # Links grouped by URL as they arrive — the shape the reporter
+        # consumes directly — instead of a flat all_links list that the
+        # reporter would regroup in a second O(N) pass. The dict's
+        # insertion order doubles as the deduped check order.
+        link_occurrences: dict = {}
+
         try:
+            last_flush = time.monotonic()
+            pending = 0
+            pages_done = 0
             for i, url in enumerate(page_urls):
-                crawl_check = session.execute(
-                    select(Crawl).where(Crawl.id == crawl_id)
-                ).scalar_one_or_none()
-                
-                if crawl_check and crawl_check.status == CrawlStatus.CANCELLED:
+                if cancel_event.is_set():
                     break
-                
                 links = crawler.crawl_page(url)
-                all_links.extend(links)
-                
-                crawl.pages_crawled = i + 1
-                session.commit()
+                for link in links:
+                    if keep is None or keep(link):
+                        link_occurrences.setdefault(link.link_url, []).append(link)
+
+                pages_done = i + 1
+                pending += 1
+                if (
+                    pending >= PROGRESS_BATCH
+                    or time.monotonic() - last_flush >= PROGRESS_INTERVAL
+                ):
+                    _flush_progress(session, crawl, "pages_crawled", pages_done)
+                    last_flush = time.monotonic()
+                    pending = 0
+                    if _crawl_status(session, crawl_id) == CrawlStatus.CANCELLED:
+                        break
+            _flush_progress(session, crawl, "pages_crawled", pages_done)
         finally:
             crawler.close()
-        
-        crawl_check = session.execute(
-            select(Crawl).where(Crawl.id == crawl_id)
-        ).scalar_one_or_none()
-        
-        if crawl_check and crawl_check.status == CrawlStatus.CANCELLED:
+
+        if cancel_event.is_set() or _crawl_status(session, crawl_id) == CrawlStatus.CANCELLED:
             return {"status": "cancelled"}
         
-        if crawl.internal_only:
-            all_links = [link for link in all_links if link.is_internal]
-        elif crawl.external_only:
-            all_links = [link for link in all_links if not link.is_internal]
-        
-        unique_urls = list(set(link.link_url for link in all_links))
-        
+        unique_urls = list(link_occurrences)
+
         if not unique_urls:
             crawl.status = CrawlStatus.COMPLETED
             crawl.completed_at = datetime.utcnow()
             session.commit()
+            notify_progress(crawl)
             return {"status": "completed", "links_checked": 0}
         
         checker = LinkChecker(
@@ -197,27 +325,41 @@ def _run_crawl_sync(crawl_id: str):
         link_statuses = {}
         
         try:
-            for i, url in enumerate(unique_urls):
-                crawl_check = session.execute(
-                    select(Crawl).where(Crawl.id == crawl_id)
-                ).scalar_one_or_none()
-                
-                if crawl_check and crawl_check.status == CrawlStatus.CANCELLED:
-                    break
-                
-                status = checker.check_link(url)
-                link_statuses[url] = status
-                
-                crawl.links_checked = i + 1
-                session.commit()
+            last_flush = time.monotonic()
+            pending = 0
+            workers = min(LINK_CHECK_WORKERS, len(unique_urls))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(checker.check_link, url): url
+                    for url in unique_urls
+                }
+                for future in as_completed(futures):
+                    link_statuses[futures[future]] = future.result()
+
+                    if cancel_event.is_set():
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        break
+
+                    pending += 1
+                    if (
+                        pending >= PROGRESS_BATCH
+                        or time.monotonic() - last_flush >= PROGRESS_INTERVAL
+                    ):
+                        _flush_progress(
+                            session, crawl, "links_checked", len(link_statuses)
+                        )
+                        last_flush = time.monotonic()
+                        pending = 0
+                        if _crawl_status(session, crawl_id) == CrawlStatus.CANCELLED:
+                            for pending_future in futures:
+                                pending_future.cancel()
+                            break
+            _flush_progress(session, crawl, "links_checked", len(link_statuses))
         finally:
             checker.close()
-        
-        crawl_check = session.execute(
-            select(Crawl).where(Crawl.id == crawl_id)
-        ).scalar_one_or_none()
-        
-        if crawl_check and crawl_check.status == CrawlStatus.CANCELLED:
+
+        if cancel_event.is_set() or _crawl_status(session, crawl_id) == CrawlStatus.CANCELLED:
             return {"status": "cancelled"}
         
         reporter = ReportGenerator(
@@ -225,11 +367,15 @@ def _run_crawl_sync(crawl_id: str):
             skip_ok=crawl.skip_ok,
         )
 
-        df = reporter.generate_report(all_links, link_statuses)
+        df = reporter.generate_report(
+            [], link_statuses, link_occurrences=link_occurrences
+        )
 
         # Orphaned page detection — sitemap mode only
         # crawl_task always operates in sitemap mode (crawl.sitemap_url is always set)
-        orphan_df = reporter.generate_orphan_report(page_urls, all_links)
+        orphan_df = reporter.generate_orphan_report(
+            page_urls, chain.from_iterable(link_occurrences.values())
+        )
         orphan_count = len(orphan_df)
         if orphan_count > 0:
             import pandas as pd
@@ -258,8 +404,9 @@ def _run_crawl_sync(crawl_id: str):
         crawl.status = CrawlStatus.COMPLETED
         crawl.completed_at = datetime.utcnow()
         session.commit()
+        notify_progress(crawl)
 
-        trigger_webhooks(session, crawl, "crawl_completed")
+        trigger_webhooks(crawl, "crawl_completed")
 
         return {
             "status": "completed",
@@ -278,7 +425,8 @@ def _run_crawl_sync(crawl_id: str):
             crawl.error_message = str(e)
             crawl.completed_at = datetime.utcnow()
             session.commit()
-            trigger_webhooks(session, crawl, "crawl_failed")
+            notify_progress(crawl)
+            trigger_webhooks(crawl, "crawl_failed")
 
         return {"error": str(e)}
     
@@ -292,12 +440,10 @@ def run_crawl_celery(crawl_id: str):
     return _run_crawl_sync(crawl_id)
 
 
+# Worker-side registration. Guarded so importing this module never
+# decorates against a None celery_app (use_celery on, celery missing).
 if settings.use_celery:
-    try:
-        from .celery_app import celery_app
-        if celery_app:
-            run_crawl_celery = celery_app.task(bind=True)(
-                lambda self, crawl_id: _run_crawl_sync(crawl_id)
-            )
-    except ImportError:
-        pass
+    from .celery_app import celery_app
+
+    if celery_app is not None:
+        run_crawl_celery = celery_app.task(name=CELERY_TASK_NAME)(run_crawl_celery)
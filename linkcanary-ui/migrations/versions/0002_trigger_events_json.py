@@ -0,0 +1,67 @@
+"""Store webhook trigger_events as JSON instead of CSV text.
+
+Converts the column type and splits any existing comma-separated values
+into JSON arrays so the model can keep the value as a list end-to-end.
+
+Revision ID: 0002_trigger_events_json
+Revises: 0001_initial
+Create Date: 2026-08-28
+"""
+import json
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002_trigger_events_json"
+down_revision: Union[str, None] = "0001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, trigger_events FROM webhooks")
+    ).fetchall()
+
+    with op.batch_alter_table("webhooks") as batch:
+        batch.alter_column(
+            "trigger_events",
+            existing_type=sa.Text(),
+            type_=sa.JSON(),
+            existing_nullable=True,
+        )
+
+    for webhook_id, raw in rows:
+        if raw is None:
+            continue
+        events = [e.strip() for e in raw.split(",") if e.strip()]
+        bind.execute(
+            sa.text("UPDATE webhooks SET trigger_events = :events WHERE id = :id"),
+            {"events": json.dumps(events), "id": webhook_id},
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, trigger_events FROM webhooks")
+    ).fetchall()
+
+    for webhook_id, raw in rows:
+        if raw is None:
+            continue
+        events = json.loads(raw) if isinstance(raw, str) else raw
+        bind.execute(
+            sa.text("UPDATE webhooks SET trigger_events = :events WHERE id = :id"),
+            {"events": ",".join(events), "id": webhook_id},
+        )
+
+    with op.batch_alter_table("webhooks") as batch:
+        batch.alter_column(
+            "trigger_events",
+            existing_type=sa.JSON(),
+            type_=sa.Text(),
+            existing_nullable=True,
+        )
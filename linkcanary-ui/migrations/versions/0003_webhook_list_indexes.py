@@ -0,0 +1,32 @@
+"""Index the webhook list filters.
+
+list_webhooks filters on enabled/type and orders by created_at; these
+composite indexes turn that from a sequential scan plus sort into an
+index scan.
+
+Revision ID: 0003_webhook_list_indexes
+Revises: 0002_trigger_events_json
+Create Date: 2026-08-28
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003_webhook_list_indexes"
+down_revision: Union[str, None] = "0002_trigger_events_json"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_webhooks_enabled_created", "webhooks", ["enabled", "created_at"]
+    )
+    op.create_index(
+        "ix_webhooks_type_created", "webhooks", ["type", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhooks_type_created", table_name="webhooks")
+    op.drop_index("ix_webhooks_enabled_created", table_name="webhooks")
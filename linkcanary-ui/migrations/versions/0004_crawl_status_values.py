@@ -0,0 +1,66 @@
+"""Store crawl status as lowercase enum values.
+
+The old Enum(CrawlStatus) column persisted member names ('PENDING',
+'IN_PROGRESS', ...); the model now reads and writes the lowercase
+member values through a plain VARCHAR. Rewrite existing rows so status
+comparisons keep matching, and install the CHECK constraint that guards
+the column.
+
+Revision ID: 0004_crawl_status_values
+Revises: 0003_webhook_list_indexes
+Create Date: 2026-08-28
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004_crawl_status_values"
+down_revision: Union[str, None] = "0003_webhook_list_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_STATUS_VALUES = ("pending", "in_progress", "completed", "failed", "cancelled")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for value in _STATUS_VALUES:
+        bind.execute(
+            sa.text("UPDATE crawls SET status = :value WHERE status = :name"),
+            {"value": value, "name": value.upper()},
+        )
+
+    with op.batch_alter_table("crawls") as batch:
+        batch.alter_column(
+            "status",
+            existing_type=sa.Enum(
+                *(value.upper() for value in _STATUS_VALUES), name="crawlstatus"
+            ),
+            type_=sa.String(16),
+            existing_nullable=False,
+        )
+        batch.create_check_constraint(
+            "ck_crawls_status",
+            "status IN ('pending', 'in_progress', 'completed', 'failed', 'cancelled')",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("crawls") as batch:
+        batch.drop_constraint("ck_crawls_status", type_="check")
+        batch.alter_column(
+            "status",
+            existing_type=sa.String(16),
+            type_=sa.Enum(
+                *(value.upper() for value in _STATUS_VALUES), name="crawlstatus"
+            ),
+            existing_nullable=False,
+        )
+
+    bind = op.get_bind()
+    for value in _STATUS_VALUES:
+        bind.execute(
+            sa.text("UPDATE crawls SET status = :name WHERE status = :value"),
+            {"value": value, "name": value.upper()},
+        )
@@ -0,0 +1,41 @@
+"""Add the stored total_issues column to crawls.
+
+/api/stats aggregates the generated total_issues column; databases
+created before the model grew it raise "no such column" because
+create_all never alters existing tables. SQLite cannot ADD a stored
+generated column, so the batch rebuild is forced: the copy recreates
+the table with the column and computes it for every existing row.
+
+Revision ID: 0005_crawl_total_issues
+Revises: 0004_crawl_status_values
+Create Date: 2026-08-28
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005_crawl_total_issues"
+down_revision: Union[str, None] = "0004_crawl_status_values"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("crawls", recreate="always") as batch:
+        batch.add_column(
+            sa.Column(
+                "total_issues",
+                sa.Integer(),
+                sa.Computed(
+                    "issues_critical + issues_high + issues_medium + issues_low",
+                    persisted=True,
+                ),
+                nullable=False,
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("crawls") as batch:
+        batch.drop_column("total_issues")
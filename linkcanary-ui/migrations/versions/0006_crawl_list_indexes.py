@@ -0,0 +1,31 @@
+"""Index the crawl list filters.
+
+list_crawls orders by created_at and filters by status; the model
+declares ix_crawls_created_at and ix_crawls_status_created_at but
+create_all never adds indexes to existing tables, so upgraded
+databases kept scanning. Same shape as 0003 for the webhook list.
+
+Revision ID: 0006_crawl_list_indexes
+Revises: 0005_crawl_total_issues
+Create Date: 2026-08-28
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0006_crawl_list_indexes"
+down_revision: Union[str, None] = "0005_crawl_total_issues"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_crawls_created_at", "crawls", ["created_at"])
+    op.create_index(
+        "ix_crawls_status_created_at", "crawls", ["status", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_crawls_status_created_at", table_name="crawls")
+    op.drop_index("ix_crawls_created_at", table_name="crawls")
@@ -149,6 +149,20 @@ class TestNormalizeUrl:
         result = normalize_url("http://example.com:8080/blog/")
         assert "8080" in result
 
+    def test_keep_port_ending_in_default_port_digits(self):
+        # :8000 ends in the characters of ':80'; only the exact
+        # default-port suffix may be removed.
+        result = normalize_url("http://example.com:8000/blog/")
+        assert result == "http://example.com:8000/blog/"
+
+    def test_keep_host_ending_in_default_port_digits(self):
+        result = normalize_url("http://intranet80/blog/")
+        assert result == "http://intranet80/blog/"
+
+    def test_keep_https_host_ending_in_443_digits(self):
+        result = normalize_url("https://host443/blog/")
+        assert result == "https://host443/blog/"
+
     def test_remove_fragment(self):
         result = normalize_url("https://example.com/blog/#section")
         assert result == "https://example.com/blog/"
@@ -221,6 +235,32 @@ class TestIsCanonicalRedirect:
             "https://example.com/blog/",
         )
 
+    def test_explicit_default_port_is_canonical(self):
+        assert is_canonical_redirect(
+            "http://example.com:80/blog/",
+            "http://example.com/blog/",
+        )
+
+    def test_explicit_https_default_port_is_canonical(self):
+        assert is_canonical_redirect(
+            "https://example.com:443/blog/",
+            "https://example.com/blog/",
+        )
+
+    def test_host_ending_in_port_digits_not_stripped(self):
+        # 'intranet80' must not collapse to 'intranet': only an exact
+        # ':80' suffix is a default port.
+        assert not is_canonical_redirect(
+            "http://intranet80/blog/",
+            "http://intranet/blog/",
+        )
+
+    def test_different_non_default_ports_not_canonical(self):
+        assert not is_canonical_redirect(
+            "http://example.com:8080/blog/",
+            "http://example.com:8000/blog/",
+        )
+
 
 class TestShouldSkipLink:
     """Tests for link filtering."""